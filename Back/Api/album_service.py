@@ -0,0 +1,181 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import List, Optional
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from core import database
+from core.cache import TTLCache
+from core.config import get_config
+from core.metrics import register_stats
+from core.models import AlbumImport
+from core.singleflight import SingleFlight
+from core.spotify_scheduler import spotify_scheduler, INTERACTIVE
+from Api.crud import resolve_song_ids
+
+config = get_config()
+
+# Spotify 앨범 트랙 조회 최대 페이지 크기
+ALBUM_TRACKS_PAGE_SIZE = 50
+
+# 가져오기가 끝난 앨범 응답 캐시 (DB 기록 앞단)
+_album_cache = TTLCache(maxsize=config.album_cache_size, ttl=config.album_import_ttl)
+
+# 같은 앨범을 동시에 가져오는 요청 합치기
+album_flights = SingleFlight('album_import')
+
+_stats = {
+    'memory_hits': 0,
+    'db_hits': 0,
+    'imports': 0,
+}
+
+def get_album_cache_stats() -> dict:
+    """앨범 가져오기 캐시 통계"""
+    return {**_stats, 'memory_entries': len(_album_cache), **album_flights.stats()}
+
+register_stats('album_import', get_album_cache_stats)
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+def _album_response(album_info: dict, track_list: List[dict], imported_at: datetime) -> dict:
+    return {
+        "album": album_info,
+        "tracks": track_list,
+        "total_tracks": len(track_list),
+        "timestamp": imported_at.isoformat()
+    }
+
+async def load_album_tracks(album_id: str) -> dict:
+    """
+    Spotify 앨범의 모든 트랙 (song_id 포함)
+    - 인메모리 캐시 → 앨범 가져오기 기록(album_imports) 순서로 조회
+    - 기록이 없거나 ALBUM_IMPORT_TTL보다 오래됐을 때만 Spotify에서 다시 가져와 저장
+    """
+    cached = _album_cache.get(album_id)
+    if cached is not None:
+        _stats['memory_hits'] += 1
+        return cached
+
+    response = await _load_import(album_id)
+    if response is not None:
+        _stats['db_hits'] += 1
+        return response
+
+    return await album_flights.do(album_id, lambda: _import_album(album_id))
+
+async def _load_import(album_id: str) -> Optional[dict]:
+    async with database.DBSessionLocal() as db:
+        result = await db.execute(select(AlbumImport).where(AlbumImport.spotify_album_id == album_id))
+        row = result.scalars().first()
+
+    if row is None:
+        return None
+
+    remaining = config.album_import_ttl - (datetime.now(timezone.utc) - _as_utc(row.imported_at)).total_seconds()
+    if remaining <= 0:
+        return None
+
+    response = _album_response(row.album, row.tracks, _as_utc(row.imported_at))
+    _album_cache.set(album_id, response, ttl=remaining)
+    return response
+
+async def _import_album(album_id: str) -> dict:
+    # 여러 요청이 공유하는 작업이므로 별도 세션 사용
+    async with database.DBSessionLocal() as db:
+        album_info, track_list = await _fetch_and_save(db, album_id)
+
+        imported_at = datetime.now(timezone.utc)
+        stmt = pg_insert(AlbumImport).values(
+            spotify_album_id=album_id,
+            album=album_info,
+            tracks=track_list,
+            imported_at=imported_at
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['spotify_album_id'],
+            set_={'album': stmt.excluded.album, 'tracks': stmt.excluded.tracks, 'imported_at': stmt.excluded.imported_at}
+        )
+        await db.execute(stmt)
+        await db.commit()
+
+    _stats['imports'] += 1
+    response = _album_response(album_info, track_list, imported_at)
+    _album_cache.set(album_id, response)
+    return response
+
+async def _fetch_track_page(album_id: str, offset: int) -> List[dict]:
+    params = {'limit': ALBUM_TRACKS_PAGE_SIZE, 'offset': offset}
+    response = await spotify_scheduler.request(
+        'GET', f'/albums/{album_id}/tracks', params=params, priority=INTERACTIVE, timeout=10
+    )
+    if response.status != 200:
+        raise Exception(f"Spotify API error: {response.status} - {response.text}")
+    return response.data.get('items', [])
+
+async def _fetch_and_save(db: AsyncSession, album_id: str):
+    """Spotify에서 앨범 트랙을 가져와 DB에 저장 (실패 시 예외 발생)"""
+    # 1. 앨범 정보 가져오기 (응답에 트랙 첫 페이지가 포함됨)
+    album_response = await spotify_scheduler.request('GET', f'/albums/{album_id}', priority=INTERACTIVE, timeout=10)
+    if album_response.status != 200:
+        raise Exception(f"Spotify API error: {album_response.status} - {album_response.text}")
+
+    album_data = album_response.data
+    album_info = {
+        'id': album_data.get('id'),
+        'name': album_data.get('name'),
+        'artists': [artist.get('name') for artist in album_data.get('artists', [])],
+        'release_date': album_data.get('release_date'),
+        'total_tracks': album_data.get('total_tracks'),
+        'image': album_data.get('images', [{}])[0].get('url') if album_data.get('images') else None
+    }
+
+    # 2. 나머지 트랙 페이지는 total 기준으로 오프셋을 계산해 동시에 요청
+    first_page = album_data.get('tracks', {})
+    all_tracks = list(first_page.get('items', []))
+    total = first_page.get('total', len(all_tracks))
+
+    offsets = range(len(all_tracks), total, ALBUM_TRACKS_PAGE_SIZE)
+    pages = await asyncio.gather(*(_fetch_track_page(album_id, offset) for offset in offsets))
+    for page in pages:
+        all_tracks.extend(page)
+
+    print(f"앨범 {album_id}에서 총 {len(all_tracks)}개 트랙 발견")
+
+    # 3. 트랙을 한 번에 DB에 저장하고 song_id 생성
+    valid_tracks = [
+        track for track in all_tracks
+        if track.get('name') and track.get('artists')
+    ]
+    song_ids = await resolve_song_ids(db, [
+        {
+            'title': track.get('name'),
+            'artist': track['artists'][0].get('name'),
+            'album': album_info.get('name'),
+            'duration_ms': track.get('duration_ms'),
+            'preview_url': track.get('preview_url'),
+            'spotify_id': track.get('id'),
+            'image_small': album_info.get('image')
+        }
+        for track in valid_tracks
+    ], "spotify")
+
+    track_list = []
+    for track, song_id in zip(valid_tracks, song_ids):
+        if song_id:
+            track_list.append({
+                'spotify_id': track.get('id'),
+                'song_id': song_id,
+                'name': track.get('name'),
+                'artists': [artist.get('name') for artist in track.get('artists', [])],
+                'duration_ms': track.get('duration_ms'),
+                'preview_url': track.get('preview_url'),
+                'track_number': track.get('track_number'),
+                'disc_number': track.get('disc_number', 1),
+                'url': track.get('external_urls', {}).get('spotify'),
+                'album_info': album_info  # 앨범 정보 포함
+            })
+
+    print(f"DB 저장 완료: {len(track_list)}개 트랙")
+    return album_info, track_list
@@ -0,0 +1,105 @@
+from datetime import datetime
+from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.config import get_config
+from core.http_client import request
+from core.snapshot import SnapshotStore
+from Api.track_resolver import resolve_tracks
+from Api.crud import bulk_save_tracks_to_db
+from Api.dto import ChartResponse
+
+config = get_config()
+
+async def fetch_lastfm_chart(limit: int = 100) -> List[dict]:
+    """Last.fm 차트 트랙 목록 가져오기"""
+    params = {
+        'method': 'chart.gettoptracks',
+        'api_key': config.LastfmAPIKEY,
+        'format': 'json',
+        'limit': limit
+    }
+
+    response = await request('lastfm', 'GET', config.lastfm_api_url, params=params, timeout=10)
+    if response.status != 200:
+        raise Exception(f"Status code: {response.status}, Message: {response.text}")
+
+    return response.data['tracks']['track']
+
+async def build_chart(db: AsyncSession) -> dict:
+    """Last.fm 차트 + Spotify 상세 정보로 ChartResponse 생성 (실패 시 예외 발생)"""
+    # 1. Last.fm 차트 데이터 가져오기
+    tracks = await fetch_lastfm_chart()
+
+    print(f"Last.fm 차트 {len(tracks)}곡 가져오기 완료, Spotify 상세 정보 검색 시작...")
+
+    # 2. 모든 트랙의 Spotify 상세 정보 가져오기 (이미지 + 시간 + 앨범 정보, 캐시 우선)
+    details_list = await resolve_tracks([
+        (track.get('name'), track.get('artist', {}).get('name')) for track in tracks
+    ])
+
+    # 3. DB에 저장할 트랙 데이터 준비 (상세 정보 포함)
+    tracks_for_db = []
+    for i, (track, spotify_details) in enumerate(zip(tracks, details_list), start=1):
+        spotify_details = spotify_details or {}
+        if spotify_details:
+            print(f"✓ {i}/{len(tracks)} - {track.get('name')} (Spotify 상세 정보 찾음)")
+        else:
+            print(f"✗ {i}/{len(tracks)} - {track.get('name')} (Spotify 정보 없음)")
+
+        tracks_for_db.append({
+            'title': track.get('name'),
+            'artist': track.get('artist', {}).get('name'),
+            'album': spotify_details.get('album_name'),  # 앨범 정보 추가
+            'duration_ms': spotify_details.get('duration_ms'),  # 재생 시간 추가
+            'preview_url': spotify_details.get('preview_url'),  # 미리듣기 URL 추가
+            'image_small': spotify_details.get('album_image'),
+            'playcount': track.get('playcount'),
+            'listeners': track.get('listeners'),
+            'url': track.get('url')
+        })
+
+    # 4. 한 번의 bulk upsert로 song_id 생성
+    song_ids = await bulk_save_tracks_to_db(db, tracks_for_db, "lastfm")
+
+    # 5. 순위 순서대로 응답 구성
+    track_list = []
+    for i, (track, track_data, song_id) in enumerate(zip(tracks, tracks_for_db, song_ids), start=1):
+        spotify_image = track_data['image_small']
+
+        track_info = {
+            'rank': i,
+            'title': track_data['title'],
+            'playcount': track.get('playcount'),
+            'listeners': track.get('listeners'),
+            'mbid': track.get('mbid'),
+            'url': track.get('url'),
+            'song_id': song_id,
+            'artist': {
+                'name': track_data['artist'],
+                'mbid': track.get('artist', {}).get('mbid'),
+                'url': track.get('artist', {}).get('url')
+            },
+            'album': track_data['album'],
+            'duration_ms': track_data['duration_ms'],
+            'image_small': spotify_image,
+            'image_source': 'spotify' if spotify_image else None
+        }
+        track_list.append(track_info)
+
+    print(f"차트 데이터 처리 완료: {len(track_list)}곡")
+
+    chart = ChartResponse(
+        tracks=track_list,
+        total_count=len(track_list),
+        timestamp=datetime.now().isoformat()
+    )
+    return chart.model_dump(mode="json")
+
+# 차트 스냅샷 저장소 (앱 lifespan에서 start/stop)
+chart_snapshots = SnapshotStore(
+    kind="chart",
+    builder=build_chart,
+    soft_ttl=config.chart_snapshot_soft_ttl,
+    refresh_interval=config.chart_snapshot_refresh_interval,
+    keep_versions=config.snapshot_keep_versions
+)
@@ -1,14 +1,40 @@
 # Api/crud.py 수정사항
 
+import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from typing import Optional
+from sqlalchemy import func
+from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from typing import List, Optional
 from core.models import Song, Artist, Album
-import requests
 from core.config import get_config
 
 config = get_config()
 
+# 재시도할 일시적 DB 오류 (SQLSTATE: 직렬화 실패, 교착 상태)
+TRANSIENT_SQLSTATES = {'40001', '40P01'}
+
+def make_artist_id(artist_name: str, source: str) -> str:
+    """아티스트 이름으로 내부 아티스트 ID 생성"""
+    # 특수문자 처리를 더 안전하게
+    safe_artist_name = (artist_name.lower()
+                       .replace(' ', '_')
+                       .replace('&', 'and')
+                       .replace('/', '_')
+                       .replace('(', '')
+                       .replace(')', '')
+                       .replace('[', '')
+                       .replace(']', '')
+                       .replace('"', '')
+                       .replace("'", '')
+                       .replace('.', '')
+                       .replace(',', '')
+                       .replace('!', '')
+                       .replace('?', ''))
+
+    return f"{source}_{safe_artist_name}"
+
 async def save_track_to_db(db: AsyncSession, track_data: dict, source: str = "lastfm") -> Optional[int]:
     """트랙 정보를 DB에 저장하고 song_id 반환 - 강화된 버전"""
     
@@ -49,23 +75,7 @@ async def save_track_to_db(db: AsyncSession, track_data: dict, source: str = "la
         
         # 2. 아티스트 ID 생성 및 처리
         try:
-            # 특수문자 처리를 더 안전하게
-            safe_artist_name = (artist_name.lower()
-                               .replace(' ', '_')
-                               .replace('&', 'and')
-                               .replace('/', '_')
-                               .replace('(', '')
-                               .replace(')', '')
-                               .replace('[', '')
-                               .replace(']', '')
-                               .replace('"', '')
-                               .replace("'", '')
-                               .replace('.', '')
-                               .replace(',', '')
-                               .replace('!', '')
-                               .replace('?', ''))
-            
-            artist_id = f"{source}_{safe_artist_name}"
+            artist_id = make_artist_id(artist_name, source)
             print(f"🎤 아티스트 ID 생성: {artist_id}")
             
             # 아티스트 확인/생성
@@ -208,67 +218,221 @@ async def save_track_to_db(db: AsyncSession, track_data: dict, source: str = "la
         await savepoint.rollback()
         return None
 
+def _normalize_track_row(track_data: dict, source: str) -> Optional[dict]:
+    """bulk 저장용 트랙 데이터 정리 (유효하지 않으면 None)"""
+    track_name = track_data.get('title') or track_data.get('name')
+
+    # 아티스트 이름 추출 (여러 형태 지원)
+    artist = track_data.get('artist')
+    artist_name = None
+    if isinstance(artist, dict):
+        artist_name = artist.get('name')
+    elif isinstance(artist, str):
+        artist_name = artist
+    elif isinstance(artist, list) and len(artist) > 0:
+        artist_name = artist[0]
+
+    if not isinstance(track_name, str) or not track_name.strip():
+        return None
+    if not isinstance(artist_name, str) or not artist_name.strip():
+        return None
+
+    track_name = track_name.strip()
+    artist_name = artist_name.strip()
+
+    # 컬럼 길이를 넘는 값은 한 건 때문에 전체 INSERT가 실패하지 않도록 제외
+    if len(track_name) > 100 or len(artist_name) > 100:
+        return None
+
+    album_title = None
+    album = track_data.get('album')
+    if isinstance(album, str):
+        album_title = album.strip()
+    elif isinstance(album, dict):
+        album_title = (album.get('name') or '').strip()
+    if not album_title or len(album_title) > 100:
+        album_title = None
+
+    return {
+        'title': track_name,
+        'artist_name': artist_name,
+        'artist_id': make_artist_id(artist_name, source),
+        'artist_image': track_data.get('artist_image'),
+        'artist_lastfm_id': track_data.get('artist_lastfm_id'),
+        'album_title': album_title,
+        'cover_url': track_data.get('image_small') or track_data.get('image'),
+        'duration_ms': track_data.get('duration_ms'),
+        'preview_url': track_data.get('preview_url'),
+        'spotify_id': track_data.get('spotify_id'),
+    }
+
+async def bulk_save_tracks_to_db(db: AsyncSession, tracks: List[dict], source: str = "lastfm") -> List[Optional[int]]:
+    """
+    여러 트랙을 한 번에 DB에 저장하고 입력 순서대로 song_id 목록 반환
+    - 아티스트 → 앨범 → 트랙 순서로 각각 INSERT ... ON CONFLICT 한 번씩 실행
+    - 유효하지 않은 트랙 위치에는 None 반환
+    """
+    rows = [_normalize_track_row(track_data, source) for track_data in tracks]
+    valid_rows = [row for row in rows if row]
+
+    if not valid_rows:
+        return [None] * len(tracks)
+
+    async with db.begin_nested():
+        # 1. 아티스트 (이미 있으면 그대로 사용)
+        artist_values = {}
+        for row in valid_rows:
+            artist_values.setdefault(row['artist_id'], {
+                'id': row['artist_id'],
+                'name': row['artist_name'],
+                'image_url': row['artist_image'],
+                'spotify_id': None,  # 나중에 업데이트
+                'lastfm_id': row['artist_lastfm_id'],
+            })
+
+        # 동시 실행 시 교착 상태를 피하기 위해 키 순서로 정렬
+        artist_stmt = pg_insert(Artist).values(
+            [artist_values[key] for key in sorted(artist_values)]
+        ).on_conflict_do_nothing()
+        await db.execute(artist_stmt)
+
+        # 2. 앨범 (없으면 생성, 있으면 비어 있는 커버만 채움)
+        album_values = {}
+        for row in valid_rows:
+            if row['album_title']:
+                album_values.setdefault((row['album_title'], row['artist_id']), {
+                    'title': row['album_title'],
+                    'artist_id': row['artist_id'],
+                    'cover_url': row['cover_url'],
+                    'spotify_id': None,  # 나중에 업데이트
+                })
+
+        album_ids = {}
+        if album_values:
+            album_stmt = pg_insert(Album).values([album_values[key] for key in sorted(album_values)])
+            album_stmt = album_stmt.on_conflict_do_update(
+                constraint='uq_albums_title_artist',
+                set_={'cover_url': func.coalesce(Album.cover_url, album_stmt.excluded.cover_url)}
+            ).returning(Album.id, Album.title, Album.artist_id)
+            result = await db.execute(album_stmt)
+            album_ids = {(title, artist_id): album_id for album_id, title, artist_id in result.all()}
+
+        # 3. 트랙 - 다른 곡이 이미 쓰고 있는 spotify_id는 유니크 충돌이 나지 않도록 비움
+        spotify_ids = {row['spotify_id'] for row in valid_rows if row['spotify_id']}
+        spotify_id_owners = {}
+        if spotify_ids:
+            result = await db.execute(
+                select(Song.spotify_id, Song.title, Song.artist_id).where(Song.spotify_id.in_(spotify_ids))
+            )
+            spotify_id_owners = {spotify_id: (title, artist_id) for spotify_id, title, artist_id in result.all()}
+
+        song_values = {}
+        for row in valid_rows:
+            key = (row['title'], row['artist_id'])
+            if key in song_values:
+                continue
+
+            spotify_id = row['spotify_id']
+            if spotify_id and spotify_id_owners.setdefault(spotify_id, key) != key:
+                spotify_id = None
+
+            song_values[key] = {
+                'title': row['title'],
+                'artist_id': row['artist_id'],
+                'album_id': album_ids.get((row['album_title'], row['artist_id'])),
+                'duration_ms': row['duration_ms'],
+                'preview_url': row['preview_url'],
+                'spotify_id': spotify_id,
+            }
+
+        song_stmt = pg_insert(Song).values([song_values[key] for key in sorted(song_values)])
+        song_stmt = song_stmt.on_conflict_do_update(
+            constraint='uq_songs_title_artist',
+            # 기존 트랙은 비어 있는 정보만 채움
+            set_={
+                'duration_ms': func.coalesce(Song.duration_ms, song_stmt.excluded.duration_ms),
+                'preview_url': func.coalesce(Song.preview_url, song_stmt.excluded.preview_url),
+                'spotify_id': func.coalesce(Song.spotify_id, song_stmt.excluded.spotify_id),
+                'album_id': func.coalesce(Song.album_id, song_stmt.excluded.album_id),
+            }
+        ).returning(Song.id, Song.title, Song.artist_id)
+        result = await db.execute(song_stmt)
+        song_ids = {(title, artist_id): song_id for song_id, title, artist_id in result.all()}
+
+    print(f"✅ bulk 저장 완료: {len(song_ids)}곡 (입력 {len(tracks)}곡)")
+
+    return [song_ids.get((row['title'], row['artist_id'])) if row else None for row in rows]
+
+def is_transient_db_error(error: Exception) -> bool:
+    """재시도하면 성공할 수 있는 DB 오류인지 확인 (연결 끊김, 교착 상태, 직렬화 실패)"""
+    if not isinstance(error, DBAPIError):
+        return False
+    if isinstance(error, OperationalError) or error.connection_invalidated:
+        return True
+
+    orig = error.orig
+    sqlstate = getattr(orig, 'sqlstate', None) or getattr(getattr(orig, '__cause__', None), 'sqlstate', None)
+    return sqlstate in TRANSIENT_SQLSTATES
+
+async def resolve_song_ids(db: AsyncSession, tracks: List[dict], source: str = "spotify", max_retries: int = 3) -> List[Optional[int]]:
+    """
+    여러 트랙의 song_id를 입력 순서대로 한 번에 조회/생성
+    - spotify_id로 이미 저장된 곡을 한 번에 조회하고, 나머지만 bulk 저장
+    - 일시적인 DB 오류일 때만 재시도
+    """
+    for attempt in range(max_retries):
+        try:
+            return await _resolve_song_ids(db, tracks, source)
+        except Exception as e:
+            if not is_transient_db_error(e) or attempt == max_retries - 1:
+                raise
+            print(f"⚠️ song_id 조회 재시도 ({attempt + 1}/{max_retries}): {str(e)}")
+            if getattr(e, 'connection_invalidated', False):
+                await db.rollback()
+            await asyncio.sleep(0.1 * (attempt + 1))
+
+async def _resolve_song_ids(db: AsyncSession, tracks: List[dict], source: str) -> List[Optional[int]]:
+    song_ids: List[Optional[int]] = [None] * len(tracks)
+
+    # 1. spotify_id로 이미 저장된 곡 조회
+    spotify_ids = {track.get('spotify_id') for track in tracks if track.get('spotify_id')}
+    known = {}
+    if spotify_ids:
+        result = await db.execute(select(Song.spotify_id, Song.id).where(Song.spotify_id.in_(spotify_ids)))
+        known = dict(result.all())
+
+    missing = []
+    for index, track in enumerate(tracks):
+        song_id = known.get(track.get('spotify_id'))
+        if song_id:
+            song_ids[index] = song_id
+        else:
+            missing.append(index)
+
+    # 2. 나머지는 한 번에 저장
+    if missing:
+        saved = await bulk_save_tracks_to_db(db, [tracks[index] for index in missing], source)
+        for index, song_id in zip(missing, saved):
+            song_ids[index] = song_id
+
+    return song_ids
+
 async def get_spotify_track_details(track_name: str, artist_name: str) -> Optional[dict]:
-    """Spotify에서 트랙 상세 정보 가져오기 - 개선된 버전"""
+    """Spotify에서 트랙 상세 정보 가져오기 - 검색 결과 캐시 사용"""
     try:
         print(f"🎧 Spotify 상세 정보 요청: '{track_name}' by '{artist_name}'")
         
-        # Spotify API 토큰 가져오기
-        from Api.spotify_service import get_spotify_token
-        access_token = get_spotify_token()
+        from Api.track_resolver import resolve_track
+        from core.spotify_scheduler import INTERACTIVE
+        result = await resolve_track(track_name, artist_name, INTERACTIVE)
         
-        search_url = 'https://api.spotify.com/v1/search'
-        headers = {
-            'Authorization': f'Bearer {access_token}'
-        }
-        
-        # 검색 쿼리 (더 정확한 매칭을 위해)
-        query = f'track:"{track_name}" artist:"{artist_name}"'
-        params = {
-            'q': query,
-            'type': 'track',
-            'limit': 1,
-        }
-        
-        response = requests.get(search_url, headers=headers, params=params, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            tracks = data.get('tracks', {}).get('items', [])
-            
-            if tracks:
-                track = tracks[0]
-                album = track.get('album', {})
-                artists = track.get('artists', [])
-                
-                # 이미지 URL 추출
-                album_images = album.get('images', [])
-                album_image = None
-                if album_images:
-                    # 300x300 크기 우선, 없으면 첫 번째
-                    for img in album_images:
-                        if img.get('height') == 300:
-                            album_image = img.get('url')
-                            break
-                    if not album_image and album_images:
-                        album_image = album_images[0].get('url')
-                
-                result = {
-                    'spotify_id': track.get('id'),
-                    'duration_ms': track.get('duration_ms'),
-                    'preview_url': track.get('preview_url'),
-                    'album_name': album.get('name'),
-                    'album_spotify_id': album.get('id'),
-                    'album_image': album_image,
-                    'artist_spotify_id': artists[0].get('id') if artists else None
-                }
-                
-                print(f"✅ Spotify 상세 정보 획득: {result}")
-                return result
+        if result:
+            print(f"✅ Spotify 상세 정보 획득: {result}")
+            return result
         
         print(f"⚠️ Spotify에서 트랙을 찾을 수 없음")
         return None
                         
     except Exception as e:
         print(f"❌ Spotify 상세 정보 가져오기 실패: {str(e)}")
-        return None
\ No newline at end of file
+        return None
@@ -17,6 +17,8 @@ class ChartTrack(BaseModel):
     url: str
     song_id: Optional[int] = None
     artist: ArtistInfo
+    album: Optional[str] = None
+    duration_ms: Optional[int] = None
     image_small: Optional[str] = None
     image_source: Optional[str] = None
 
@@ -24,6 +26,7 @@ class ChartResponse(BaseModel):
     tracks: List[ChartTrack]
     total_count: int
     timestamp: str
+    version: Optional[int] = None  # 차트 스냅샷 버전
 
 # 검색 응답 관련 DTO
 class SearchAlbum(BaseModel):
@@ -58,6 +61,7 @@ class SearchResponse(BaseModel):
     albums: List[SearchAlbum]
     tracks: List[SearchTrack]
     artists: List[SearchArtist]
+    debug_info: Optional[Dict[str, int]] = None  # song_id 생성 통계
 
 # DB 저장용 내부 DTO
 class TrackDataForDB(BaseModel):
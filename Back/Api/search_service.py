@@ -0,0 +1,209 @@
+import re
+import unicodedata
+from typing import Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from core import database
+from core.cache import TTLCache
+from core.config import get_config
+from core.metrics import register_stats
+from core.singleflight import SingleFlight
+from core.spotify_scheduler import spotify_scheduler, INTERACTIVE
+from Api.crud import resolve_song_ids
+
+config = get_config()
+
+# Spotify 검색 타입 (type 파라미터 기본값)
+SEARCH_TYPES = ('album', 'track', 'artist')
+
+# 진행 중인 동일 검색 합치기
+search_flights = SingleFlight('search')
+
+# 완성된 검색 응답 캐시 - 키는 (정규화된 검색어, 정렬된 검색 타입)
+_search_cache = TTLCache(maxsize=config.search_cache_size, ttl=config.search_cache_ttl)
+
+_cache_stats = {'hits': 0, 'misses': 0}
+
+def get_search_cache_stats() -> dict:
+    """검색 결과 캐시 통계"""
+    lookups = _cache_stats['hits'] + _cache_stats['misses']
+    return {
+        **_cache_stats,
+        'entries': len(_search_cache),
+        'hit_ratio': round(_cache_stats['hits'] / lookups, 4) if lookups else None,
+    }
+
+register_stats('search_singleflight', search_flights.stats)
+register_stats('search_cache', get_search_cache_stats)
+
+def normalize_search_query(query: str) -> str:
+    """검색어 정규화 (유니코드 정규화, 대소문자, 공백 무시)"""
+    query = unicodedata.normalize('NFKC', query or '')
+    return re.sub(r'\s+', ' ', query).strip().casefold()
+
+def parse_search_types(types: Optional[str]) -> Tuple[str, ...]:
+    """type 파라미터("track,artist" 형식)를 정렬된 검색 타입 목록으로 변환"""
+    if not types:
+        return tuple(sorted(SEARCH_TYPES))
+
+    parsed = {value.strip().lower() for value in types.split(',')}
+    return tuple(sorted(parsed & set(SEARCH_TYPES))) or tuple(sorted(SEARCH_TYPES))
+
+async def search_spotify(query: str, types: Optional[str] = None):
+    """
+    Spotify 검색 + 검색된 트랙의 song_id 생성
+    - 완성된 응답(song_id 포함)을 TTL 캐시에 보관해 같은 검색은 DB 저장 없이 바로 반환
+    - 같은 검색어로 동시에 들어온 요청은 진행 중인 검색 하나의 결과를 함께 사용
+    """
+    key = (normalize_search_query(query), parse_search_types(types))
+
+    cached = _search_cache.get(key)
+    if cached is not None:
+        _cache_stats['hits'] += 1
+        return cached
+
+    _cache_stats['misses'] += 1
+    return await search_flights.do(key, lambda: _search_and_save(key, query))
+
+async def _search_and_save(key: tuple, query: str):
+    # 여러 요청이 공유하는 작업이므로 특정 요청의 세션 대신 별도 세션 사용
+    async with database.DBSessionLocal() as db:
+        result, cacheable = await _search_with_session(db, query, key[1])
+        await db.commit()
+
+    # 오류 메시지(문자열)와 song_id를 만들지 못한 응답은 캐시하지 않음
+    if cacheable:
+        _search_cache.set(key, result)
+    return result
+
+async def _search_with_session(db: AsyncSession, query: str, types: Tuple[str, ...]) -> Tuple[object, bool]:
+    """Spotify 검색 결과와 캐시 가능 여부 반환"""
+    params = {
+        'q': query,
+        'type': ','.join(types),
+        'limit': 10,
+    }
+    
+    try:
+        response = await spotify_scheduler.request('GET', '/search', params=params, priority=INTERACTIVE)
+    except Exception as e:
+        return f"Failed to search Spotify: {str(e)}", False
+    
+    if response.status == 200:
+        data = response.data
+
+        # 앨범 처리 (기존 동일)
+        raw_albums = data.get('albums', {}).get('items', [])
+        albums = []
+        for album in raw_albums:
+            album_summary = {
+                'id': album.get('id'),
+                'name': album.get('name'),
+                'artists': [artist.get('name') for artist in album.get('artists', [])],
+                'release_date': album.get('release_date'),
+                'total_tracks': album.get('total_tracks'),
+                'image': album.get('images', [{}])[0].get('url'),
+                'url': album.get('external_urls', {}).get('spotify')
+            }
+            albums.append(album_summary)
+
+        # 트랙 처리 - song_id는 한 번에 조회/생성
+        raw_tracks = data.get('tracks', {}).get('items', [])
+        print(f"🎵 검색된 트랙 수: {len(raw_tracks)}")
+
+        valid_tracks = []
+        tracks_for_db = []
+        for track in raw_tracks:
+            # 기본 정보 검증
+            track_name = track.get('name')
+            track_artists = track.get('artists', [])
+            artist_name = track_artists[0].get('name') if track_artists else None
+
+            if not track_name or not artist_name:
+                print(f"⚠️ 필수 정보 누락: title={track_name}, artist={artist_name}")
+                continue
+
+            # 트랙의 앨범 이미지 가져오기
+            album_images = track.get('album', {}).get('images', [])
+            track_image = None
+            if album_images:
+                for img in album_images:
+                    if img.get('height') == 300:
+                        track_image = img.get('url')
+                        break
+                if not track_image:
+                    track_image = album_images[0].get('url')
+
+            valid_tracks.append((track, track_image))
+            tracks_for_db.append({
+                'title': track_name,
+                'artist': artist_name,
+                'album': track.get('album', {}).get('name'),
+                'duration_ms': track.get('duration_ms'),
+                'preview_url': track.get('preview_url'),
+                'image_small': track_image,
+                'spotify_id': track.get('id')
+            })
+
+        try:
+            song_ids = await resolve_song_ids(db, tracks_for_db, "spotify")
+            song_ids_resolved = True
+        except Exception as e:
+            print(f"❌ song_id 조회 중 오류: {str(e)}")
+            await db.rollback()
+            song_ids = [None] * len(tracks_for_db)
+            song_ids_resolved = False
+
+        tracks = []
+        for (track, track_image), song_id in zip(valid_tracks, song_ids):
+            tracks.append({
+                'id': track.get('id'),  # Spotify ID
+                'name': track.get('name'),
+                'artists': [artist.get('name') for artist in track.get('artists', [])],
+                'album': track.get('album', {}).get('name'),
+                'duration_ms': track.get('duration_ms'),
+                'preview_url': track.get('preview_url'),
+                'image': track_image,
+                'url': track.get('external_urls', {}).get('spotify'),
+                'song_id': song_id  # None일 수도 있음
+            })
+
+        # 아티스트 처리 (기존 동일)
+        raw_artists = data.get('artists', {}).get('items', [])
+        artists = []
+        for artist in raw_artists:
+            artist_summary = {
+                'id': artist.get('id'),
+                'name': artist.get('name'),
+                'genres': artist.get('genres'),
+                'followers': artist.get('followers', {}).get('total'),
+                'image': artist.get('images', [{}])[0].get('url'),
+                'url': artist.get('external_urls', {}).get('spotify')
+            }
+            artists.append(artist_summary)
+
+        # 결과 통계
+        tracks_with_song_id = [t for t in tracks if t.get('song_id')]
+        tracks_without_song_id = [t for t in tracks if not t.get('song_id')]
+        
+        print(f"""
+        📊 검색 결과 통계:
+        - 총 트랙: {len(tracks)}
+        - song_id 있음: {len(tracks_with_song_id)}
+        - song_id 없음: {len(tracks_without_song_id)}
+        """)
+
+        search_Info = {
+            'albums': albums,
+            'tracks': tracks,
+            'artists': artists,
+            'debug_info': {
+                'total_tracks': len(tracks),
+                'tracks_with_song_id': len(tracks_with_song_id),
+                'tracks_without_song_id': len(tracks_without_song_id)
+            }
+        }
+        return search_Info, song_ids_resolved
+
+    else:
+        error_message = f"Error: {response.status}, {response.text}"
+        return error_message, False
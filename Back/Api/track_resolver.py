@@ -0,0 +1,192 @@
+import asyncio
+import re
+import unicodedata
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.future import select
+from core import database
+from core.cache import TTLCache
+from core.config import get_config
+from core.metrics import register_stats
+from core.models import SpotifyTrackCache
+from core.spotify_scheduler import BACKGROUND
+from Api.spotify_service import fetch_spotify_track_details
+
+config = get_config()
+
+# 조회 결과 상태
+FOUND = 'found'
+NOT_FOUND = 'not_found'  # Spotify에 일치하는 트랙 없음
+ERROR = 'error'          # 일시적 오류 (타임아웃, 비정상 응답 등)
+
+# 캐시에 저장하는 Spotify 트랙 상세 정보 필드
+DETAIL_FIELDS = (
+    'spotify_id', 'duration_ms', 'preview_url', 'album_name',
+    'album_spotify_id', 'album_image', 'artist_spotify_id'
+)
+
+# DB 캐시 앞단의 인프로세스 LRU - 값은 (상태, 상세 정보)
+_memory_cache = TTLCache(
+    maxsize=config.spotify_track_cache_size,
+    ttl=config.spotify_track_cache_ttl
+)
+
+# 캐시 효과 확인용 카운터
+_stats = {
+    'hits': 0,           # 캐시에서 찾은 트랙
+    'negative_hits': 0,  # 캐시된 실패 결과로 Spotify 호출을 건너뛴 트랙
+    'misses': 0,         # Spotify 검색이 필요했던 트랙
+    'not_found': 0,      # Spotify 검색 결과 없음
+    'errors': 0,         # Spotify 검색 실패
+}
+
+def get_resolver_stats() -> dict:
+    """트랙 검색 캐시 통계"""
+    lookups = _stats['hits'] + _stats['negative_hits'] + _stats['misses']
+    return {
+        **_stats,
+        'memory_entries': len(_memory_cache),
+        'hit_ratio': round((_stats['hits'] + _stats['negative_hits']) / lookups, 4) if lookups else None,
+    }
+
+register_stats('spotify_track_cache', get_resolver_stats)
+
+def _ttl_for(status: str) -> int:
+    if status == NOT_FOUND:
+        return config.spotify_not_found_ttl
+    if status == ERROR:
+        return config.spotify_error_ttl
+    return config.spotify_track_cache_ttl
+
+def normalize_track_key(track_name: Optional[str], artist_name: Optional[str]) -> str:
+    """트랙명 + 아티스트명을 정규화한 캐시 키 (유니코드 정규화, 대소문자, 공백 무시)"""
+    def normalize(value: Optional[str]) -> str:
+        value = unicodedata.normalize('NFKC', value or '')
+        return re.sub(r'\s+', ' ', value).strip().casefold()
+
+    return f"{normalize(track_name)}\x1f{normalize(artist_name)}"
+
+async def resolve_tracks(pairs: List[Tuple[str, str]], priority: int = BACKGROUND) -> List[Optional[dict]]:
+    """
+    (트랙명, 아티스트명) 목록의 Spotify 상세 정보 조회 (입력 순서 유지)
+    - 인메모리 LRU → DB 캐시 → Spotify 검색 순서로 조회
+    - 찾지 못한 트랙과 일시적 오류도 각각 짧은 TTL로 캐시해 반복 검색을 건너뜀
+    """
+    keys = [normalize_track_key(track_name, artist_name) for track_name, artist_name in pairs]
+    results = {}
+
+    # 1. 인메모리 LRU
+    for key in set(keys):
+        entry = _memory_cache.get(key)
+        if entry is not None:
+            results[key] = entry
+
+    # 2. DB 캐시 (한 번의 조회)
+    missing = [key for key in dict.fromkeys(keys) if key not in results]
+    if missing:
+        results.update(await _load_from_db(missing))
+
+    # 3. Spotify 검색 (동시 요청)
+    missing_pairs = {}
+    for key, pair in zip(keys, pairs):
+        if key not in results:
+            missing_pairs.setdefault(key, pair)
+
+    counts = Counter(keys)
+    for key, (status, _) in results.items():
+        _stats['hits' if status == FOUND else 'negative_hits'] += counts[key]
+
+    if missing_pairs:
+        _stats['misses'] += sum(counts[key] for key in missing_pairs)
+        fetched = dict(zip(missing_pairs, await _fetch_from_spotify(list(missing_pairs.values()), priority)))
+        await _store(fetched)
+        results.update(fetched)
+
+    return [results[key][1] if key in results else None for key in keys]
+
+async def resolve_track(track_name: str, artist_name: str, priority: int = BACKGROUND) -> Optional[dict]:
+    """단일 트랙의 Spotify 상세 정보 조회 (캐시 사용)"""
+    return (await resolve_tracks([(track_name, artist_name)], priority))[0]
+
+async def _load_from_db(keys: List[str]) -> dict:
+    try:
+        async with database.DBSessionLocal() as db:
+            result = await db.execute(
+                select(SpotifyTrackCache).where(
+                    SpotifyTrackCache.cache_key.in_(keys),
+                    SpotifyTrackCache.expires_at > datetime.now(timezone.utc)
+                )
+            )
+            rows = result.scalars().all()
+    except Exception as e:
+        print(f"Error loading Spotify track cache: {str(e)}")
+        return {}
+
+    now = datetime.now(timezone.utc)
+    loaded = {}
+    for row in rows:
+        details = {field: getattr(row, field) for field in DETAIL_FIELDS} if row.status == FOUND else None
+        entry = (row.status, details)
+        # 항목별 남은 TTL만큼만 메모리에 보관
+        _memory_cache.set(row.cache_key, entry, ttl=(row.expires_at - now).total_seconds())
+        loaded[row.cache_key] = entry
+
+    return loaded
+
+async def _fetch_from_spotify(pairs: List[Tuple[str, str]], priority: int) -> List[Tuple[str, Optional[dict]]]:
+    semaphore = asyncio.Semaphore(config.spotify_enrich_concurrency)
+
+    async def fetch_one(track_name: str, artist_name: str) -> Tuple[str, Optional[dict]]:
+        async with semaphore:
+            try:
+                # 요청별 타임아웃과 재시도는 스케줄러가 처리 - 실패한 트랙만 격리
+                details = await fetch_spotify_track_details(track_name, artist_name, priority)
+            except Exception as e:
+                print(f"Error fetching Spotify details for {track_name} - {artist_name}: {e!r}")
+                _stats['errors'] += 1
+                return ERROR, None
+
+        if details is None:
+            _stats['not_found'] += 1
+            return NOT_FOUND, None
+        return FOUND, details
+
+    return await asyncio.gather(*(fetch_one(track_name, artist_name) for track_name, artist_name in pairs))
+
+async def _store(fetched: dict) -> None:
+    now = datetime.now(timezone.utc)
+    values = []
+
+    for key, (status, details) in sorted(fetched.items()):
+        ttl = _ttl_for(status)
+        _memory_cache.set(key, (status, details), ttl=ttl)
+
+        # 일시적 오류는 프로세스 메모리에만 짧게 보관
+        if status == ERROR:
+            continue
+
+        values.append({
+            'cache_key': key,
+            'status': status,
+            **{field: (details or {}).get(field) for field in DETAIL_FIELDS},
+            'fetched_at': now,
+            'expires_at': now + timedelta(seconds=ttl),
+        })
+
+    if not values:
+        return
+
+    try:
+        async with database.DBSessionLocal() as db:
+            stmt = pg_insert(SpotifyTrackCache).values(values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['cache_key'],
+                set_={column: stmt.excluded[column] for column in values[0] if column != 'cache_key'}
+            )
+            await db.execute(stmt)
+            await db.commit()
+    except Exception as e:
+        # 캐시 저장 실패는 응답에 영향을 주지 않음
+        print(f"Error saving Spotify track cache: {str(e)}")
@@ -1,16 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import and_
-from core.database import provide_session
-from core.models import User, user_favorite_artist
+from core.database import provide_session, provide_read_session
+from core.http_cache import check_not_modified, make_etag, PRIVATE_REVALIDATE
+from core.models import user_favorite_artist
 from User.user_router import get_current_user
+from User.principal import CurrentUser
 from Artist.dto import ArtistCommentCreate, ArtistCommentOut, SpotifyArtistOut
 from Artist.crud import (
     get_artist_by_id, save_artist_from_spotify, get_artist_info_from_spotify,
     check_artist_favorite, create_artist_comment, get_artist_comments,
     search_artists_from_spotify, get_user_favorite_artist_ids,
-    get_popular_artists_from_spotify
+    get_artists_with_metadata, get_artist_comments_marker, invalidate_user_favorites
 )
+from Artist.popular_snapshot import get_popular_artist_roster
 from typing import List, Optional
 import asyncio
 
@@ -22,10 +25,10 @@ router = APIRouter(
 # 인기 아티스트 조회 (로그인 불필요)
 @router.get("/popular", response_model=List[SpotifyArtistOut])
 async def get_popular_artists(limit: int = 20):
-    """Spotify API에서 인기 아티스트 목록 조회"""
+    """인기 아티스트 목록 조회 (백그라운드에서 미리 만든 스냅샷 사용)"""
     try:
-        artists_data = await get_popular_artists_from_spotify(limit)
-        artists = [SpotifyArtistOut.from_spotify_response(item) for item in artists_data]
+        artists_data = await get_popular_artist_roster(limit)
+        artists = [SpotifyArtistOut(**item) for item in artists_data]
         return artists
     except Exception as e:
         print(f"Error in get_popular_artists: {str(e)}")
@@ -37,23 +40,23 @@ async def get_popular_artists(limit: int = 20):
 # 인기 아티스트 조회 (로그인한 사용자용 - 좋아요 상태 포함)
 @router.get("/popular/authenticated", response_model=List[SpotifyArtistOut])
 async def get_popular_artists_authenticated(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(provide_session),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(provide_read_session),
     limit: int = 20
 ):
     """인기 아티스트 목록 조회 (좋아요 상태 포함)"""
     try:
-        # 인기 아티스트 데이터 가져오기
-        artists_data = await get_popular_artists_from_spotify(limit)
+        # 인기 아티스트 스냅샷 가져오기
+        artists_data = await get_popular_artist_roster(limit)
         
         # 사용자의 좋아요 아티스트 목록 가져오기
         favorite_artist_ids = await get_user_favorite_artist_ids(db, current_user.id)
         
-        # 좋아요 상태 포함하여 결과 가공
+        # 좋아요 상태만 덧붙여서 반환
         artists = []
         for item in artists_data:
             is_favorite = item["id"] in favorite_artist_ids
-            artists.append(SpotifyArtistOut.from_spotify_response(item, is_favorite))
+            artists.append(SpotifyArtistOut(**{**item, "is_favorite": is_favorite}))
         
         return artists
     except Exception as e:
@@ -67,7 +70,7 @@ async def get_popular_artists_authenticated(
 @router.post("/{artist_id}/favorite")
 async def toggle_artist_favorite(
     artist_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(provide_session)
 ):
     """아티스트 좋아요 토글"""
@@ -92,6 +95,7 @@ async def toggle_artist_favorite(
                 )
             )
             await db.commit()
+            invalidate_user_favorites(current_user.id)
             return {"message": "Removed from favorites", "is_favorite": False}
         else:
             # 좋아요 추가
@@ -102,6 +106,7 @@ async def toggle_artist_favorite(
                 )
             )
             await db.commit()
+            invalidate_user_favorites(current_user.id)
             return {"message": "Added to favorites", "is_favorite": True}
             
     except Exception as e:
@@ -114,7 +119,7 @@ async def toggle_artist_favorite(
 # 사용자의 좋아요 아티스트 목록 조회
 @router.get("/favorites", response_model=List[SpotifyArtistOut])
 async def get_user_favorite_artists(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(provide_session)
 ):
     """사용자의 좋아요 아티스트 목록 조회"""
@@ -122,26 +127,15 @@ async def get_user_favorite_artists(
         # 사용자의 좋아요 아티스트 ID 목록 가져오기
         favorite_artist_ids = await get_user_favorite_artist_ids(db, current_user.id)
         
-        # 각 아티스트의 상세 정보 가져오기
-        favorite_artists = []
-        for artist_id in favorite_artist_ids:
-            try:
-                # 먼저 로컬 DB에서 확인
-                artist = await get_artist_by_id(db, artist_id)
-                
-                # Spotify API에서 최신 정보 가져오기
-                spotify_data = await get_artist_info_from_spotify(artist_id)
-                
-                # 로컬 DB에 없으면 저장
-                if not artist:
-                    await save_artist_from_spotify(db, spotify_data)
-                
-                artist_data = SpotifyArtistOut.from_spotify_response(spotify_data, True)
-                favorite_artists.append(artist_data)
-                
-            except Exception as e:
-                print(f"Failed to fetch artist {artist_id}: {str(e)}")
-                continue
+        # DB에 저장된 정보 우선 사용, 오래됐거나 없는 아티스트만 Spotify에서 한 번에 갱신
+        favorite_artist_ids = sorted(favorite_artist_ids)
+        artists = await get_artists_with_metadata(db, favorite_artist_ids)
+
+        favorite_artists = [
+            SpotifyArtistOut.from_artist_row(artists[artist_id], True)
+            for artist_id in favorite_artist_ids
+            if artist_id in artists
+        ]
         
         return favorite_artists
         
@@ -156,24 +150,28 @@ async def get_user_favorite_artists(
 @router.get("/{artist_id}", response_model=SpotifyArtistOut)
 async def get_artist_info(
     artist_id: str,
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    response: Response,
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(provide_session)
 ):
     try:
-        # Spotify API에서 아티스트 정보 가져오기
-        spotify_data = await get_artist_info_from_spotify(artist_id)
+        # DB에 저장된 정보 우선 사용 (없거나 오래된 경우에만 Spotify에서 가져와 저장)
+        artists = await get_artists_with_metadata(db, [artist_id])
+        if artist_id not in artists:
+            raise Exception(f"Artist not found: {artist_id}")
+        artist = artists[artist_id]
         
         # 관심 아티스트 여부 확인
         is_favorite = await check_artist_favorite(db, current_user.id, artist_id)
         
-        # 로컬 DB에 아티스트 정보 저장 또는 업데이트
-        artist = await get_artist_by_id(db, artist_id)
+        # 메타데이터 갱신 시각 + 좋아요 여부가 같으면 304
+        etag = make_etag("artist", artist_id, artist.fetched_at.isoformat() if artist.fetched_at else None, is_favorite)
+        cached = check_not_modified(request, response, etag, PRIVATE_REVALIDATE)
+        if cached:
+            return cached
         
-        if not artist:
-            # 새 아티스트 정보 저장
-            await save_artist_from_spotify(db, spotify_data)
-        
-        return SpotifyArtistOut.from_spotify_response(spotify_data, is_favorite)
+        return SpotifyArtistOut.from_artist_row(artist, is_favorite)
     
     except Exception as e:
         print(f"Error in get_artist_info: {str(e)}")
@@ -186,8 +184,8 @@ async def get_artist_info(
 @router.get("/search/{query}", response_model=List[SpotifyArtistOut])
 async def search_artists(
     query: str,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(provide_session),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(provide_read_session),
     limit: int = 10
 ):
     try:
@@ -238,7 +236,7 @@ async def public_search_artists(
 async def create_comment(
     artist_id: str,
     comment: ArtistCommentCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(provide_session)
 ):
     # 아티스트가 존재하는지 확인
@@ -273,8 +271,16 @@ async def create_comment(
 @router.get("/{artist_id}/comments", response_model=List[ArtistCommentOut])
 async def get_comments(
     artist_id: str,
-    db: AsyncSession = Depends(provide_session)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(provide_read_session)
 ):
+    # 최신 댓글 ID + 댓글 수가 같으면 목록 조회 없이 304
+    newest_id, count = await get_artist_comments_marker(db, artist_id)
+    cached = check_not_modified(request, response, make_etag("artist_comments", artist_id, newest_id, count))
+    if cached:
+        return cached
+    
     # 특정 아티스트의 댓글과 작성자 정보 함께 조회
     comments_data = await get_artist_comments(db, artist_id)
     
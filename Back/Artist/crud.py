@@ -1,117 +1,182 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import and_
-from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy import and_, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Dict, Any, Tuple, FrozenSet
+import re
+from core.cache import TTLCache
+from core.config import get_config
 from core.models import Artist, ArtistComment, User, user_favorite_artist
 from Artist.dto import ArtistCommentCreate, SpotifyArtistOut
-import requests
 import asyncio
-from Artist.auth import get_spotify_access_token
+from core.spotify_scheduler import spotify_scheduler, INTERACTIVE
 
-SPOTIFY_API_URL = "https://api.spotify.com/v1/artists"
+config = get_config()
+
+# Spotify 여러 아티스트 조회(/artists?ids=) 최대 ID 수
+SPOTIFY_ARTISTS_BATCH_SIZE = 50
+
+# Spotify 아티스트 ID 형식 (22자 base62) - 형식이 다른 ID가 하나라도 섞이면 요청 전체가 거절됨
+SPOTIFY_ID_PATTERN = re.compile(r'^[0-9A-Za-z]{22}$')
+
+# 사용자별 관심 아티스트 ID 집합 캐시
+_favorite_cache = TTLCache(maxsize=config.favorite_cache_size, ttl=config.favorite_cache_ttl)
+_favorite_generation = 0  # 좋아요 변경 시마다 증가
 
 async def get_artist_by_id(db: AsyncSession, artist_id: str) -> Optional[Artist]:
     """아티스트 ID로 조회 함수"""
     result = await db.execute(select(Artist).where(Artist.id == artist_id))
     return result.scalars().first()
 
+def artist_values_from_spotify(spotify_data: dict) -> dict:
+    """Spotify 아티스트 응답을 artists 테이블 컬럼 값으로 변환"""
+    return {
+        "id": spotify_data["id"],
+        "name": spotify_data["name"][:100],
+        "image_url": spotify_data["images"][0]["url"] if spotify_data.get("images") else None,
+        "spotify_id": spotify_data["id"],
+        "genres": spotify_data.get("genres", []),
+        "popularity": spotify_data.get("popularity"),
+        "followers": (spotify_data.get("followers") or {}).get("total"),
+        "fetched_at": datetime.now(timezone.utc),
+    }
+
 async def save_artist_from_spotify(db: AsyncSession, spotify_data: dict) -> Artist:
     """Spotify API 데이터로 아티스트 저장 함수"""
-    new_artist = Artist(
-        id=spotify_data["id"],
-        name=spotify_data["name"],
-        image_url=spotify_data["images"][0]["url"] if spotify_data.get("images") else None,
-        spotify_id=spotify_data["id"]
-    )
+    new_artist = Artist(**artist_values_from_spotify(spotify_data))
     db.add(new_artist)
     await db.commit()
     await db.refresh(new_artist)
     return new_artist
 
+def _artists_upsert_statement(artists_data: List[dict]):
+    """Spotify 아티스트 응답 목록의 INSERT ... ON CONFLICT 문 (저장할 것이 없으면 None)"""
+    values = {}
+    for data in artists_data:
+        if data and data.get("id"):
+            values[data["id"]] = artist_values_from_spotify(data)
+
+    if not values:
+        return None
+
+    # 동시 실행 시 교착 상태를 피하기 위해 키 순서로 정렬
+    stmt = pg_insert(Artist).values([values[key] for key in sorted(values)])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["id"],
+        set_={
+            column: stmt.excluded[column]
+            for column in ("name", "image_url", "genres", "popularity", "followers", "fetched_at")
+        }
+    )
+    return stmt
+
+async def upsert_artists_from_spotify(db: AsyncSession, artists_data: List[dict]) -> None:
+    """Spotify 아티스트 응답 목록을 한 번의 INSERT ... ON CONFLICT로 저장/갱신"""
+    stmt = _artists_upsert_statement(artists_data)
+    if stmt is None:
+        return
+
+    await db.execute(stmt)
+    await db.commit()
+
+async def get_artists_info_from_spotify(
+    artist_ids: List[str],
+    priority: int = INTERACTIVE
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Spotify /artists?ids= 로 여러 아티스트 정보 가져오기 (50개씩 나눠 동시 요청)
+    - 반환값은 ID별 아티스트 정보, Spotify에 없는 ID는 None
+    - 실패한 묶음은 로그만 남기고 결과에서 빠짐 (다른 묶음에 영향 없음)
+    """
+    chunks = [
+        artist_ids[i:i + SPOTIFY_ARTISTS_BATCH_SIZE]
+        for i in range(0, len(artist_ids), SPOTIFY_ARTISTS_BATCH_SIZE)
+    ]
+
+    async def fetch_chunk(chunk: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        try:
+            response = await spotify_scheduler.request(
+                'GET', "/artists", params={"ids": ",".join(chunk)}, priority=priority
+            )
+            if response.status != 200:
+                raise Exception(f"Spotify API error: {response.status} - {response.text}")
+        except Exception as e:
+            print(f"Failed to get {len(chunk)} artists from Spotify: {str(e)}")
+            return {}
+
+        # 요청한 ID 순서대로 반환되며 존재하지 않는 ID는 null
+        return dict(zip(chunk, response.data.get("artists", [])))
+
+    results = {}
+    for chunk_result in await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks)):
+        results.update(chunk_result)
+    return results
+
+async def get_artists_with_metadata(
+    db: AsyncSession,
+    artist_ids: List[str],
+    priority: int = INTERACTIVE
+) -> Dict[str, Artist]:
+    """
+    아티스트 ID 목록의 메타데이터를 DB 우선으로 조회
+    - fetched_at이 ARTIST_METADATA_TTL 이내인 행은 그대로 사용
+    - 오래됐거나 없는 아티스트만 Spotify에서 50개씩 가져와 한 번에 저장
+    - Spotify ID가 아닌 아티스트(lastfm_* 등)는 Spotify에 요청하지 않음
+    - Spotify 조회나 저장이 실패하면 DB에 있는 기존 정보로 응답
+    """
+    if not artist_ids:
+        return {}
+
+    result = await db.execute(select(Artist).where(Artist.id.in_(artist_ids)))
+    artists = {artist.id: artist for artist in result.scalars().all()}
+
+    fresh_after = datetime.now(timezone.utc) - timedelta(seconds=config.artist_metadata_ttl)
+    stale_ids = []
+    for artist_id in dict.fromkeys(artist_ids):
+        artist = artists.get(artist_id)
+        if artist is None:
+            if SPOTIFY_ID_PATTERN.match(artist_id):
+                stale_ids.append(artist_id)
+        elif artist.spotify_id == artist_id and (artist.fetched_at is None or artist.fetched_at < fresh_after):
+            stale_ids.append(artist_id)
+
+    if not stale_ids:
+        return artists
+
+    spotify_artists = await get_artists_info_from_spotify(stale_ids, priority)
+    stmt = _artists_upsert_statement(list(spotify_artists.values()))
+    if stmt is None:
+        return artists
+
+    try:
+        # SAVEPOINT 안에서 저장 - 실패해도 이미 불러온 행은 만료되지 않아 기존 정보로 응답 가능
+        async with db.begin_nested():
+            await db.execute(stmt)
+            result = await db.execute(
+                select(Artist)
+                .where(Artist.id.in_(stale_ids))
+                .execution_options(populate_existing=True)
+            )
+            artists.update({artist.id: artist for artist in result.scalars().all()})
+    except Exception as e:
+        print(f"Failed to save artist metadata: {str(e)}")
+
+    return artists
+
 async def get_artist_info_from_spotify(artist_id: str) -> Dict[str, Any]:
     """Spotify API에서 아티스트 정보 가져오기"""
     try:
-        access_token = get_spotify_access_token()
-        headers = {
-            "Authorization": f"Bearer {access_token}"
-        }
-        response = requests.get(f"{SPOTIFY_API_URL}/{artist_id}", headers=headers)
+        response = await spotify_scheduler.request('GET', f"/artists/{artist_id}", priority=INTERACTIVE)
         
-        if response.status_code != 200:
-            raise Exception(f"Spotify API error: {response.status_code} - {response.text}")
+        if response.status != 200:
+            raise Exception(f"Spotify API error: {response.status} - {response.text}")
         
-        return response.json()
+        return response.data
     except Exception as e:
         print(f"Error getting artist info from Spotify: {str(e)}")
         raise
 
-async def get_popular_artists_from_spotify(limit: int = 20) -> List[Dict[str, Any]]:
-    """Spotify API에서 인기 아티스트 가져오기 (개선된 버전)"""
-    try:
-        access_token = get_spotify_access_token()
-        headers = {
-            "Authorization": f"Bearer {access_token}"
-        }
-        
-        # 더 다양하고 실제로 인기 있는 아티스트들 검색
-        popular_queries = [
-            # K-Pop
-            "BTS", "BLACKPINK", "NewJeans", "IVE", "SEVENTEEN", "TWICE", "aespa", "IU",
-            "ITZY", "Red Velvet", "ENHYPEN", "LE SSERAFIM", "(G)I-DLE", "NMIXX", "STRAY KIDS",
-            
-            # Global Pop
-            "Taylor Swift", "Ed Sheeran", "Billie Eilish", "Ariana Grande", "The Weeknd",
-            "Dua Lipa", "Justin Bieber", "Olivia Rodrigo", "Harry Styles", "Doja Cat",
-            
-            # Hip-Hop/R&B
-            "Drake", "Bad Bunny", "Post Malone", "Travis Scott", "Kendrick Lamar"
-        ]
-        
-        all_artists = []
-        seen_artists = set()  # 중복 제거를 위한 set
-        
-        # 병렬 처리로 속도 향상
-        semaphore = asyncio.Semaphore(5)  # 동시 요청 수 제한
-        
-        async def fetch_artist(query):
-            async with semaphore:
-                try:
-                    params = {
-                        "q": query,
-                        "type": "artist",
-                        "limit": 1
-                    }
-                    response = requests.get("https://api.spotify.com/v1/search", headers=headers, params=params)
-                    
-                    if response.status_code == 200:
-                        artists_data = response.json()["artists"]["items"]
-                        for artist in artists_data:
-                            # 인기도 점수가 있고 중복이 아닌 경우만 추가
-                            if artist["id"] not in seen_artists and artist.get("popularity", 0) > 0:
-                                all_artists.append(artist)
-                                seen_artists.add(artist["id"])
-                                return True
-                except Exception as e:
-                    print(f"Failed to search {query}: {str(e)}")
-                return False
-        
-        # 비동기 병렬 처리
-        tasks = [fetch_artist(query) for query in popular_queries[:25]]  # 처음 25개만 처리
-        await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # 인기도 순으로 정렬
-        all_artists.sort(key=lambda x: x.get("popularity", 0), reverse=True)
-        
-        print(f"Found {len(all_artists)} popular artists")
-        
-        # 요청된 limit만큼 반환
-        return all_artists[:limit]
-        
-    except Exception as e:
-        print(f"Error getting popular artists from Spotify: {str(e)}")
-        # 에러 발생 시 빈 리스트 대신 최소한의 데이터라도 반환
-        return []
-
 async def check_artist_favorite(db: AsyncSession, user_id: int, artist_id: str) -> bool:
     """아티스트 좋아요 여부 확인 함수"""
     result = await db.execute(
@@ -136,6 +201,14 @@ async def create_artist_comment(db: AsyncSession, artist_id: str, user_id: int,
     await db.refresh(new_comment)
     return new_comment
 
+async def get_artist_comments_marker(db: AsyncSession, artist_id: str) -> Tuple[Optional[int], int]:
+    """아티스트 댓글의 최신 ID와 개수 조회 함수 (댓글 목록 ETag용)"""
+    result = await db.execute(
+        select(func.max(ArtistComment.id), func.count(ArtistComment.id))
+        .where(ArtistComment.artist_id == artist_id)
+    )
+    return tuple(result.one())
+
 async def get_artist_comments(db: AsyncSession, artist_id: str) -> List[Tuple[ArtistComment, str]]:
     """아티스트 댓글 목록 조회 함수"""
     result = await db.execute(
@@ -150,29 +223,41 @@ async def get_artist_comments(db: AsyncSession, artist_id: str) -> List[Tuple[Ar
 async def search_artists_from_spotify(query: str, limit: int = 10) -> List[Dict[str, Any]]:
     """Spotify API로 아티스트 검색 함수"""
     try:
-        access_token = get_spotify_access_token()
-        headers = {
-            "Authorization": f"Bearer {access_token}"
-        }
         params = {
             "q": query,
             "type": "artist",
             "limit": limit
         }
         
-        response = requests.get("https://api.spotify.com/v1/search", headers=headers, params=params)
+        response = await spotify_scheduler.request('GET', "/search", params=params, priority=INTERACTIVE)
         
-        if response.status_code != 200:
-            raise Exception(f"Spotify API error: {response.status_code} - {response.text}")
+        if response.status != 200:
+            raise Exception(f"Spotify API error: {response.status} - {response.text}")
         
-        return response.json()["artists"]["items"]
+        return response.data["artists"]["items"]
     except Exception as e:
         print(f"Error searching artists from Spotify: {str(e)}")
         raise
 
-async def get_user_favorite_artist_ids(db: AsyncSession, user_id: int) -> List[str]:
-    """사용자의 관심 아티스트 ID 목록 조회 함수"""
+async def get_user_favorite_artist_ids(db: AsyncSession, user_id: int) -> FrozenSet[str]:
+    """사용자의 관심 아티스트 ID 집합 조회 함수 (사용자별 캐시 사용)"""
+    cached = _favorite_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    generation = _favorite_generation
     result = await db.execute(
         select(user_favorite_artist.c.artist_id).where(user_favorite_artist.c.user_id == user_id)
     )
-    return [row[0] for row in result.all()]
\ No newline at end of file
+    favorite_artist_ids = frozenset(row[0] for row in result.all())
+
+    # 조회 중에 좋아요가 바뀌었으면 오래된 결과를 캐시하지 않음
+    if generation == _favorite_generation:
+        _favorite_cache.set(user_id, favorite_artist_ids)
+    return favorite_artist_ids
+
+def invalidate_user_favorites(user_id: int) -> None:
+    """관심 아티스트 추가/삭제 후 해당 사용자의 캐시 제거"""
+    global _favorite_generation
+    _favorite_generation += 1
+    _favorite_cache.pop(user_id)
@@ -36,4 +36,17 @@ class SpotifyArtistOut(BaseModel):
             popularity=data.get("popularity", 0),
             followers=data.get("followers", {}).get("total", 0),
             is_favorite=is_favorite
-        )
\ No newline at end of file
+        )
+
+    @classmethod
+    def from_artist_row(cls, artist, is_favorite: bool = False):
+        """DB에 저장된 아티스트(Artist 모델)로 응답 생성"""
+        return cls(
+            id=artist.id,
+            name=artist.name,
+            genres=artist.genres or [],
+            image_url=artist.image_url,
+            popularity=artist.popularity or 0,
+            followers=artist.followers or 0,
+            is_favorite=is_favorite
+        )
@@ -0,0 +1,115 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from sqlalchemy import update
+from sqlalchemy.future import select
+from core import database
+from core.config import get_config
+from core.metrics import register_stats
+from core.models import Artist
+from core.spotify_scheduler import BACKGROUND
+from Artist.crud import get_artists_info_from_spotify, upsert_artists_from_spotify
+
+config = get_config()
+
+
+class ArtistMetadataRefresher:
+    """
+    아티스트 메타데이터(장르, 인기도, 팔로워) 백그라운드 갱신 작업
+    - 주기마다 fetched_at이 가장 오래된 아티스트부터 batch_size명씩 Spotify에서 다시 가져옴
+    - 오래된 행이 더 남아 있으면 쉬지 않고 다음 배치 진행
+    - Spotify에 없는(삭제된) 아티스트는 fetched_at만 갱신해 TTL 동안 배치에서 제외
+    """
+
+    def __init__(self, interval: float, batch_size: int, ttl: float):
+        self.interval = interval
+        self.batch_size = batch_size
+        self.ttl = ttl
+        self._worker_task: Optional[asyncio.Task] = None
+        self._stats = {
+            'runs': 0,
+            'refreshed': 0,
+            'not_found': 0,
+            'errors': 0,
+            'last_run_at': None,
+        }
+
+    async def start(self) -> None:
+        if self._worker_task is None:
+            self._worker_task = asyncio.create_task(self._run_worker())
+
+    async def stop(self) -> None:
+        if self._worker_task and not self._worker_task.done():
+            self._worker_task.cancel()
+            try:
+                await self._worker_task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._worker_task = None
+
+    async def refresh_batch(self) -> int:
+        """가장 오래된 아티스트 한 배치 갱신 후 fetched_at이 갱신된 행 수 반환 (실패한 묶음은 제외)"""
+        stale_before = datetime.now(timezone.utc) - timedelta(seconds=self.ttl)
+
+        async with database.DBSessionLocal() as db:
+            # Spotify ID로 저장된 아티스트만 갱신 가능
+            result = await db.execute(
+                select(Artist.id)
+                .where(
+                    Artist.id == Artist.spotify_id,
+                    (Artist.fetched_at.is_(None)) | (Artist.fetched_at < stale_before)
+                )
+                .order_by(Artist.fetched_at.asc().nulls_first())
+                .limit(self.batch_size)
+            )
+            artist_ids = [row[0] for row in result.all()]
+            if not artist_ids:
+                return 0
+
+            fetched = await get_artists_info_from_spotify(artist_ids, BACKGROUND)
+            spotify_artists = [artist for artist in fetched.values() if artist]
+            missing_ids = [artist_id for artist_id, artist in fetched.items() if artist is None]
+
+            await upsert_artists_from_spotify(db, spotify_artists)
+            if missing_ids:
+                # null로 반환된 ID를 그대로 두면 nulls_first 정렬로 매 배치 맨 앞에 다시 선택됨
+                await db.execute(
+                    update(Artist)
+                    .where(Artist.id.in_(missing_ids))
+                    .values(fetched_at=datetime.now(timezone.utc))
+                )
+                await db.commit()
+
+        self._stats['refreshed'] += len(spotify_artists)
+        self._stats['not_found'] += len(missing_ids)
+        print(f"아티스트 메타데이터 {len(spotify_artists)}/{len(artist_ids)}명 갱신 완료 (Spotify에 없음: {len(missing_ids)}명)")
+        return len(spotify_artists) + len(missing_ids)
+
+    async def _run_worker(self) -> None:
+        while True:
+            self._stats['runs'] += 1
+            self._stats['last_run_at'] = datetime.now(timezone.utc).isoformat()
+            try:
+                count = await self.refresh_batch()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error refreshing artist metadata: {str(e)}")
+                self._stats['errors'] += 1
+                count = 0
+
+            # 배치 전체가 갱신됐으면 오래된 행이 더 있을 수 있으므로 바로 다음 배치 진행
+            await asyncio.sleep(1.0 if count >= self.batch_size else self.interval)
+
+    def stats(self) -> dict:
+        return dict(self._stats)
+
+
+# 아티스트 메타데이터 갱신 작업 (앱 lifespan에서 start/stop)
+artist_metadata_refresher = ArtistMetadataRefresher(
+    interval=config.artist_refresh_interval,
+    batch_size=config.artist_refresh_batch_size,
+    ttl=config.artist_metadata_ttl
+)
+
+register_stats('artist_metadata_refresher', artist_metadata_refresher.stats)
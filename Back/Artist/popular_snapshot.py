@@ -0,0 +1,83 @@
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.config import get_config
+from core.snapshot import SnapshotStore
+from core.spotify_scheduler import spotify_scheduler, BACKGROUND
+from Artist.crud import upsert_artists_from_spotify
+from Artist.dto import SpotifyArtistOut
+
+config = get_config()
+
+# 인기 아티스트 목록을 만들 때 검색하는 아티스트
+POPULAR_QUERIES = [
+    # K-Pop
+    "BTS", "BLACKPINK", "NewJeans", "IVE", "SEVENTEEN", "TWICE", "aespa", "IU",
+    "ITZY", "Red Velvet", "ENHYPEN", "LE SSERAFIM", "(G)I-DLE", "NMIXX", "STRAY KIDS",
+
+    # Global Pop
+    "Taylor Swift", "Ed Sheeran", "Billie Eilish", "Ariana Grande", "The Weeknd",
+    "Dua Lipa", "Justin Bieber", "Olivia Rodrigo", "Harry Styles", "Doja Cat",
+
+    # Hip-Hop/R&B
+    "Drake", "Bad Bunny", "Post Malone", "Travis Scott", "Kendrick Lamar"
+][:25]  # 처음 25개만 처리
+
+async def _search_top_artist(query: str) -> Optional[Dict[str, Any]]:
+    params = {
+        "q": query,
+        "type": "artist",
+        "limit": 1
+    }
+    try:
+        response = await spotify_scheduler.request('GET', "/search", params=params, priority=BACKGROUND)
+        if response.status == 200:
+            items = response.data["artists"]["items"]
+            return items[0] if items else None
+        print(f"Failed to search {query}: {response.status}")
+    except Exception as e:
+        print(f"Failed to search {query}: {str(e)}")
+    return None
+
+async def build_popular_artists(db: AsyncSession) -> dict:
+    """인기 아티스트 목록 생성 (검색은 스케줄러를 통해 동시에 실행)"""
+    results = await asyncio.gather(*(_search_top_artist(query) for query in POPULAR_QUERIES))
+
+    artists = []
+    seen_artists = set()  # 중복 제거를 위한 set
+    for artist in results:
+        # 인기도 점수가 있고 중복이 아닌 경우만 추가
+        if artist and artist["id"] not in seen_artists and artist.get("popularity", 0) > 0:
+            artists.append(artist)
+            seen_artists.add(artist["id"])
+
+    if not artists:
+        raise Exception("No popular artists found")
+
+    # 인기도 순으로 정렬
+    artists.sort(key=lambda x: x.get("popularity", 0), reverse=True)
+
+    # 아티스트 메타데이터도 DB에 저장
+    await upsert_artists_from_spotify(db, artists)
+
+    print(f"Found {len(artists)} popular artists")
+
+    return {
+        "artists": [SpotifyArtistOut.from_spotify_response(artist).model_dump() for artist in artists],
+        "timestamp": datetime.now().isoformat()
+    }
+
+async def get_popular_artist_roster(limit: int = 20) -> List[Dict[str, Any]]:
+    """인기 아티스트 스냅샷에서 상위 limit명 반환 (SpotifyArtistOut 형식 dict)"""
+    snapshot = await popular_artist_snapshots.get()
+    return snapshot.payload["artists"][:limit]
+
+# 인기 아티스트 스냅샷 저장소 (앱 lifespan에서 start/stop)
+popular_artist_snapshots = SnapshotStore(
+    kind="popular_artists",
+    builder=build_popular_artists,
+    soft_ttl=config.popular_artists_snapshot_soft_ttl,
+    refresh_interval=config.popular_artists_snapshot_refresh_interval,
+    keep_versions=config.snapshot_keep_versions
+)
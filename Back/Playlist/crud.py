@@ -1,6 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import and_, delete
+from sqlalchemy import and_, delete, func, update
 from typing import List, Optional, Dict, Any
 from core.models import Playlist, PlaylistSong, Song, UserLikedSong, Artist, Album
 from Playlist.dto import PlaylistCreate, PlaylistUpdate
@@ -81,3 +81,22 @@ async def check_song_liked(db: AsyncSession, user_id: int, song_id: int) -> Opti
     
     return result.scalars().first()
 
+
+# 플레이리스트 버전 증가 (노래 목록 ETag 갱신)
+async def bump_playlist_version(db: AsyncSession, playlist_id: int) -> None:
+    """플레이리스트 내용 변경 시 버전 증가 함수"""
+    await db.execute(
+        update(Playlist)
+        .where(Playlist.id == playlist_id)
+        .values(version=Playlist.version + 1)
+    )
+
+# 사용자 좋아요 상태 요약 (노래 목록 ETag용)
+async def get_user_likes_marker(db: AsyncSession, user_id: int) -> tuple:
+    """사용자의 좋아요 수와 마지막 좋아요 시각 조회 함수"""
+    result = await db.execute(
+        select(func.count(UserLikedSong.song_id), func.max(UserLikedSong.liked_at))
+        .where(UserLikedSong.user_id == user_id)
+    )
+    count, last_liked_at = result.one()
+    return count, last_liked_at.isoformat() if last_liked_at else None
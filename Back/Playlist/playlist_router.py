@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from core.database import provide_session
-from core.models import User, Playlist, PlaylistSong, Song, UserLikedSong, Artist, Album
+from core.database import provide_session, provide_read_session
+from core.http_cache import check_not_modified, make_etag, PRIVATE_REVALIDATE
+from core.models import Playlist, PlaylistSong, Song, UserLikedSong, Artist, Album
 from User.user_router import get_current_user
+from User.principal import CurrentUser
 from Playlist.dto import (
     PlaylistCreate, PlaylistResponse, PlaylistUpdate, 
     PlaylistSongAdd, PlaylistSongResponse
 )
+from Playlist.crud import bump_playlist_version, get_user_likes_marker
 from typing import List, Optional
 from sqlalchemy.future import select
 from sqlalchemy import and_, delete, func
@@ -27,7 +30,7 @@ router = APIRouter(
 @router.post("/", response_model=PlaylistResponse, status_code=status.HTTP_201_CREATED)
 async def create_playlist(
     playlist_data: PlaylistCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(provide_session)
 ):
     """새 플레이리스트 생성"""
@@ -60,8 +63,8 @@ async def create_playlist(
 # 사용자의 플레이리스트 목록 조회
 @router.get("/my-playlists", response_model=List[PlaylistResponse])
 async def get_my_playlists(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(provide_session)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(provide_read_session)
 ):
     """현재 사용자의 플레이리스트 목록 조회"""
     try:
@@ -89,8 +92,8 @@ async def get_my_playlists(
 @router.get("/{playlist_id}", response_model=PlaylistResponse)
 async def get_playlist(
     playlist_id: int,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(provide_session)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(provide_read_session)
 ):
     """플레이리스트 정보 조회"""
     try:
@@ -130,7 +133,7 @@ async def get_playlist(
 async def update_playlist(
     playlist_id: int,
     playlist_data: PlaylistUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(provide_session)
 ):
     """플레이리스트 정보 수정"""
@@ -166,6 +169,7 @@ async def update_playlist(
         
         # updated_at 필드 수동 업데이트
         playlist.updated_at = datetime.utcnow()
+        playlist.version = Playlist.version + 1
         
         await db.commit()
         await db.refresh(playlist)
@@ -188,10 +192,15 @@ async def update_playlist(
 @router.get("/{playlist_id}/songs")
 async def get_playlist_songs(
     playlist_id: int,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(provide_session)
+    request: Request,
+    response: Response,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(provide_read_session)
 ):
-    """플레이리스트의 노래 목록 조회 - 앨범 정보 제거"""
+    """
+    플레이리스트의 노래 목록 조회 - 앨범 정보 제거
+    - 플레이리스트 버전 + 사용자 좋아요 상태로 ETag를 만들고, 일치하면 노래 조회 없이 304 반환
+    """
     try:
         logger.info(f"플레이리스트 {playlist_id} 노래 목록 조회 시작")
         
@@ -212,6 +221,12 @@ async def get_playlist_songs(
                 detail="Playlist not found or you don't have permission to access it"
             )
         
+        likes_marker = await get_user_likes_marker(db, current_user.id)
+        etag = make_etag("playlist_songs", playlist_id, playlist.version, current_user.id, likes_marker)
+        cached = check_not_modified(request, response, etag, PRIVATE_REVALIDATE)
+        if cached:
+            return cached
+        
         # 2. 플레이리스트 노래 목록 조회
         playlist_songs_result = await db.execute(
             select(PlaylistSong)
@@ -305,7 +320,7 @@ async def get_playlist_songs(
 async def add_song_to_playlist(
     playlist_id: int,
     song_data: PlaylistSongAdd,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(provide_session)
 ):
     """플레이리스트에 단일 노래 추가 - 개선된 버전"""
@@ -376,6 +391,7 @@ async def add_song_to_playlist(
             )
             
             db.add(new_playlist_song)
+            await bump_playlist_version(db, playlist_id)
             # begin() 블록 종료 시 자동 커밋됨
         
         logger.info(f"노래 추가 성공: song_id={song_data.song_id}, position={new_position}")
@@ -404,7 +420,7 @@ async def add_song_to_playlist(
 async def remove_song_from_playlist(
     playlist_id: int,
     song_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(provide_session)
 ):
     """플레이리스트에서 노래 제거"""
@@ -438,6 +454,8 @@ async def remove_song_from_playlist(
                 )
             )
         )
+        if delete_result.rowcount:
+            await bump_playlist_version(db, playlist_id)
         
         await db.commit()
         
@@ -470,7 +488,7 @@ async def remove_song_from_playlist(
 @router.post("/like-song/{song_id}")
 async def toggle_like_song(
     song_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(provide_session)
 ):
     """노래 좋아요 토글"""
@@ -549,8 +567,8 @@ async def toggle_like_song(
 # 좋아요한 노래 목록 조회
 @router.get("/liked-songs")
 async def get_liked_songs(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(provide_session)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(provide_read_session)
 ):
     """사용자가 좋아요한 노래 목록 조회"""
     try:
@@ -608,7 +626,7 @@ async def get_liked_songs(
 @router.delete("/{playlist_id}")
 async def delete_playlist(
     playlist_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(provide_session)
 ):
     """플레이리스트 삭제"""
@@ -679,7 +697,7 @@ async def update_song_position(
     playlist_id: int,
     song_id: int,
     new_position: int,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(provide_session)
 ):
     """플레이리스트 내 노래 순서 변경"""
@@ -739,6 +757,7 @@ async def update_song_position(
         
         # 대상 노래의 위치 업데이트
         current_song.position = new_position
+        await bump_playlist_version(db, playlist_id)
         
         await db.commit()
         
@@ -4,18 +4,9 @@ from sqlalchemy import and_, delete
 from typing import List, Optional, Dict, Any
 from core.models import User, Artist, user_favorite_artist
 from User.dto import UserCreate, UserUpdate, FavoriteArtist
-from passlib.context import CryptContext
-
-# 비밀번호 해싱 설정
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def hash_password(password: str) -> str:
-    """비밀번호 해싱 함수"""
-    return pwd_context.hash(password)
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """비밀번호 검증 함수"""
-    return pwd_context.verify(plain_password, hashed_password)
+from Artist.crud import invalidate_user_favorites
+from User.principal import invalidate_principal
+from core.dependencies import hash_password
 
 async def get_user_by_id(db: AsyncSession, user_id: int) -> Optional[User]:
     """사용자 ID로 조회 함수"""
@@ -34,7 +25,7 @@ async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
 
 async def create_user(db: AsyncSession, user_data: UserCreate) -> User:
     """사용자 생성 함수"""
-    hashed_password = hash_password(user_data.password)
+    hashed_password = await hash_password(user_data.password)
     
     # nickname이 없으면 username을 기본값으로 사용
     nickname = user_data.nickname if user_data.nickname else user_data.username
@@ -55,13 +46,15 @@ async def update_user(db: AsyncSession, user: User, update_data: Dict[str, Any])
     for key, value in update_data.items():
         setattr(user, key, value)
     await db.commit()
+    invalidate_principal(user.id)
     await db.refresh(user)
     return user
 
 async def change_password(db: AsyncSession, user: User, new_password: str) -> bool:
     """비밀번호 변경 함수"""
-    user.hashed_password = hash_password(new_password)
+    user.hashed_password = await hash_password(new_password)
     await db.commit()
+    invalidate_principal(user.id)
     return True
 
 async def get_favorite_artists(db: AsyncSession, user_id: int) -> List[Artist]:
@@ -85,6 +78,7 @@ async def add_favorite_artist(db: AsyncSession, user_id: int, artist_id: str) ->
     )
     await db.execute(stmt)
     await db.commit()
+    invalidate_user_favorites(user_id)
     return True
 
 async def remove_favorite_artist(db: AsyncSession, user_id: int, artist_id: str) -> bool:
@@ -97,6 +91,7 @@ async def remove_favorite_artist(db: AsyncSession, user_id: int, artist_id: str)
     )
     result = await db.execute(stmt)
     await db.commit()
+    invalidate_user_favorites(user_id)
     return result.rowcount > 0
 
 async def check_favorite_artist(db: AsyncSession, user_id: int, artist_id: str) -> bool:
@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from core.cache import TTLCache
+from core.config import get_config
+from core.metrics import register_stats
+
+config = get_config()
+
+
+@dataclass(frozen=True)
+class CurrentUser:
+    """인증된 사용자 정보 (세션에 묶이지 않는 가벼운 스냅샷, 비밀번호 해시 제외)"""
+    id: int
+    username: str
+    email: str
+    nickname: Optional[str]
+    created_at: Optional[datetime]
+    is_active: Optional[bool]
+
+    @classmethod
+    def from_user(cls, user) -> "CurrentUser":
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            nickname=user.nickname,
+            created_at=user.created_at,
+            is_active=user.is_active
+        )
+
+
+# 사용자 ID별 {토큰: CurrentUser} 캐시 - 사용자 정보가 바뀌면 사용자 단위로 제거
+_principal_cache = TTLCache(maxsize=config.principal_cache_size, ttl=config.principal_cache_ttl)
+_principal_generation = 0  # 사용자 정보가 바뀔 때마다 증가
+
+_stats = {'hits': 0, 'misses': 0}
+
+def get_principal_stats() -> dict:
+    """인증 사용자 캐시 통계"""
+    lookups = _stats['hits'] + _stats['misses']
+    return {
+        **_stats,
+        'entries': len(_principal_cache),
+        'hit_ratio': round(_stats['hits'] / lookups, 4) if lookups else None,
+    }
+
+register_stats('principal_cache', get_principal_stats)
+
+def get_cached_principal(user_id: int, token: str) -> Optional[CurrentUser]:
+    principal = (_principal_cache.get(user_id) or {}).get(token)
+    _stats['hits' if principal else 'misses'] += 1
+    return principal
+
+def principal_generation() -> int:
+    """사용자 조회 전에 읽어 두고 cache_principal에 전달"""
+    return _principal_generation
+
+def cache_principal(user_id: int, token: str, principal: CurrentUser, generation: int) -> None:
+    # 조회 중에 사용자 정보가 바뀌었으면 오래된 정보를 캐시하지 않음
+    if generation != _principal_generation:
+        return
+
+    tokens = _principal_cache.get(user_id) or {}
+    # 같은 사용자의 다른 토큰(다른 기기)도 함께 보관
+    _principal_cache.set(user_id, {**tokens, token: principal})
+
+def invalidate_principal(user_id: int) -> None:
+    """사용자 정보 변경, 비밀번호 변경, 비활성화 시 호출 (커밋 후)"""
+    global _principal_generation
+    _principal_generation += 1
+    _principal_cache.pop(user_id)
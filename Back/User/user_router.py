@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from core.database import provide_session
-from core.dependencies import create_jwt, verify_jwt
+from core import database
+from core.database import current_user_id, mark_user_wrote, provide_session, provide_read_session
+from core.dependencies import create_jwt, verify_jwt, verify_password, verify_and_update_password
 from core.models import User
 from User.dto import (
     UserCreate, UserResponse, UserUpdate, PasswordChange, 
@@ -9,10 +10,11 @@ from User.dto import (
 )
 from User.crud import (
     get_user_by_id, get_user_by_username, get_user_by_email,
-    create_user, update_user, change_password, hash_password, verify_password,
+    create_user, update_user, change_password,
     get_favorite_artists, add_favorite_artist, remove_favorite_artist, check_favorite_artist
 )
-from typing import List
+from User.principal import CurrentUser, cache_principal, get_cached_principal, principal_generation
+from typing import List, Optional
 from fastapi.security import OAuth2PasswordBearer
 
 router = APIRouter(
@@ -22,8 +24,8 @@ router = APIRouter(
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="users/login")
 
-# 현재 사용자 확인 의존성
-async def get_current_user(db: AsyncSession = Depends(provide_session), token: str = Depends(oauth2_scheme)):
+# 현재 사용자 확인 의존성 (캐시된 CurrentUser 반환, 캐시 hit 시 DB 조회 없음)
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> CurrentUser:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid authentication credentials",
@@ -38,10 +40,44 @@ async def get_current_user(db: AsyncSession = Depends(provide_session), token: s
     if user_id is None:
         raise credentials_exception
     
-    user = await get_user_by_id(db, int(user_id))
+    # 읽기 세션 라우팅(쓰기 직후 primary 사용)을 위해 현재 사용자 기록
+    current_user_id.set(int(user_id))
+    
+    principal = get_cached_principal(int(user_id), token)
+    if principal:
+        return principal
+    
+    generation = principal_generation()
+    user = await _load_principal_user(int(user_id))
     if user is None:
         raise credentials_exception
     
+    principal = CurrentUser.from_user(user)
+    cache_principal(user.id, token, principal, generation)
+    return principal
+
+async def _load_principal_user(user_id: int) -> Optional[User]:
+    """
+    캐시 miss 시 사용자 조회 - 짧은 읽기 세션을 바로 닫아 요청 내내 커넥션을 잡지 않음
+    - replica에 아직 없으면(가입 직후 복제 지연 등) primary에서 다시 조회
+    """
+    async with database.ReadSessionLocal() as db:
+        user = await get_user_by_id(db, user_id)
+
+    if user is None and database.replica_engine is not None:
+        async with database.DBSessionLocal() as db:
+            user = await get_user_by_id(db, user_id)
+    return user
+
+async def get_current_user_row(db: AsyncSession, current_user: CurrentUser) -> User:
+    """수정 작업용 사용자 ORM 객체 조회"""
+    user = await get_user_by_id(db, current_user.id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return user
 
 # 회원가입
@@ -61,8 +97,10 @@ async def register_user(user_data: UserCreate, db: AsyncSession = Depends(provid
             detail="Username already taken"
         )
     
-    # 사용자 생성
-    return await create_user(db, user_data)
+    # 사용자 생성 - 가입 직후 요청은 replica 대신 primary에서 읽도록 표시
+    new_user = await create_user(db, user_data)
+    mark_user_wrote(new_user.id)
+    return new_user
 
 # 로그인 - 이메일로 변경
 @router.post("/login", response_model=Token)
@@ -76,28 +114,34 @@ async def login(user_data: UserLogin, db: AsyncSession = Depends(provide_session
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # 비밀번호 확인
-    if not verify_password(user_data.password, user.hashed_password):
+    # 비밀번호 확인 (bcrypt cost가 바뀌었으면 새 cost로 재해싱)
+    is_valid, new_hash = await verify_and_update_password(user_data.password, user.hashed_password)
+    if not is_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    if new_hash:
+        user.hashed_password = new_hash
+        await db.commit()
+        mark_user_wrote(user.id)
+    
     # 토큰 생성
     access_token = create_jwt(data={"sub": str(user.id)})
     return {"access_token": access_token, "token_type": "bearer"}
 
 # 마이페이지 - 내 정보 확인
 @router.get("/me", response_model=UserResponse)
-async def read_users_me(current_user: User = Depends(get_current_user)):
+async def read_users_me(current_user: CurrentUser = Depends(get_current_user)):
     return current_user
 
 # 마이페이지 - 회원정보 수정
 @router.put("/me", response_model=UserResponse)
 async def update_user_me(
     user_data: UserUpdate, 
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(provide_session)
 ):
     # 업데이트할 데이터 수집
@@ -126,32 +170,35 @@ async def update_user_me(
         update_data["nickname"] = user_data.nickname
     
     # 사용자 업데이트
-    return await update_user(db, current_user, update_data)
+    user = await get_current_user_row(db, current_user)
+    return await update_user(db, user, update_data)
 
 # 마이페이지 - 비밀번호 변경
 @router.put("/me/password")
 async def update_password(
     password_data: PasswordChange,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(provide_session)
 ):
+    user = await get_current_user_row(db, current_user)
+    
     # 현재 비밀번호 확인
-    if not verify_password(password_data.current_password, current_user.hashed_password):
+    if not await verify_password(password_data.current_password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect"
         )
     
     # 새 비밀번호 설정
-    await change_password(db, current_user, password_data.new_password)
+    await change_password(db, user, password_data.new_password)
     
     return {"message": "Password changed successfully"}
 
 # 마이페이지 - 관심 아티스트 목록 조회
 @router.get("/me/favorite-artists", response_model=List[FavoriteArtist])
 async def get_my_favorite_artists(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(provide_session)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(provide_read_session)
 ):
     return await get_favorite_artists(db, current_user.id)
 
@@ -159,7 +206,7 @@ async def get_my_favorite_artists(
 @router.post("/me/favorite-artists")
 async def add_to_favorite_artists(
     artist_data: FavoriteArtistAdd,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(provide_session)
 ):
     from Artist.crud import get_artist_by_id
@@ -182,7 +229,7 @@ async def add_to_favorite_artists(
 @router.delete("/me/favorite-artists/{artist_id}")
 async def remove_from_favorite_artists(
     artist_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(provide_session)
 ):
     # 관심 아티스트 삭제
@@ -198,14 +245,14 @@ async def remove_from_favorite_artists(
 # 사용자의 좋아요 아티스트 ID 목록만 반환 (가벼운 API)
 @router.get("/favorite-artists", response_model=List[str])
 async def get_user_favorite_artist_ids_endpoint(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(provide_session)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(provide_read_session)
 ):
     """사용자의 좋아요 아티스트 ID 목록 조회"""
     try:
         from Artist.crud import get_user_favorite_artist_ids
         favorite_artist_ids = await get_user_favorite_artist_ids(db, current_user.id)
-        return favorite_artist_ids
+        return sorted(favorite_artist_ids)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -0,0 +1,28 @@
+"""add playlist version
+
+Revision ID: 0c5e7a93d2f8
+Revises: f3b8c62d1e95
+Create Date: 2026-10-18 16:11:37.240815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0c5e7a93d2f8'
+down_revision: Union[str, None] = 'f3b8c62d1e95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('playlists', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('playlists', 'version')
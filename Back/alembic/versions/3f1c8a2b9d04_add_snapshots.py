@@ -0,0 +1,41 @@
+"""add snapshots
+
+Revision ID: 3f1c8a2b9d04
+Revises: 74debe95020c
+Create Date: 2026-10-18 10:12:41.208133
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c8a2b9d04'
+down_revision: Union[str, None] = '74debe95020c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'snapshots',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(length=50), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('kind', 'version', name='uq_snapshots_kind_version')
+    )
+    op.create_index(op.f('ix_snapshots_id'), 'snapshots', ['id'], unique=False)
+    op.create_index(op.f('ix_snapshots_kind'), 'snapshots', ['kind'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_snapshots_kind'), table_name='snapshots')
+    op.drop_index(op.f('ix_snapshots_id'), table_name='snapshots')
+    op.drop_table('snapshots')
@@ -0,0 +1,35 @@
+"""add album imports
+
+Revision ID: a6d02f9e4b17
+Revises: e4a9b3c75d21
+Create Date: 2026-10-18 14:22:41.508193
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d02f9e4b17'
+down_revision: Union[str, None] = 'e4a9b3c75d21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'album_imports',
+        sa.Column('spotify_album_id', sa.String(length=50), nullable=False),
+        sa.Column('album', sa.JSON(), nullable=False),
+        sa.Column('tracks', sa.JSON(), nullable=False),
+        sa.Column('imported_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('spotify_album_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('album_imports')
@@ -0,0 +1,113 @@
+"""add catalog unique keys
+
+Revision ID: b52e7d10c6a9
+Revises: 3f1c8a2b9d04
+Create Date: 2026-10-18 11:03:17.552809
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b52e7d10c6a9'
+down_revision: Union[str, None] = '3f1c8a2b9d04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _merge_duplicate_albums() -> None:
+    # (title, artist_id)가 같은 앨범은 가장 작은 id로 합침 - 비어 있는 값은 중복 행의 값으로 채움
+    op.execute("""
+        CREATE TEMPORARY TABLE album_merge AS
+        SELECT old_id, new_id, spotify_id, cover_url, release_date
+        FROM (
+            SELECT id AS old_id, MIN(id) OVER (PARTITION BY title, artist_id) AS new_id,
+                   spotify_id, cover_url, release_date
+            FROM albums
+        ) ranked
+        WHERE old_id <> new_id
+    """)
+    op.execute("UPDATE songs SET album_id = m.new_id FROM album_merge m WHERE songs.album_id = m.old_id")
+    op.execute("DELETE FROM albums USING album_merge m WHERE albums.id = m.old_id")
+    op.execute("""
+        UPDATE albums SET
+            spotify_id = COALESCE(albums.spotify_id, d.spotify_id),
+            cover_url = COALESCE(albums.cover_url, d.cover_url),
+            release_date = COALESCE(albums.release_date, d.release_date)
+        FROM (
+            SELECT new_id, MIN(spotify_id) AS spotify_id, MIN(cover_url) AS cover_url, MIN(release_date) AS release_date
+            FROM album_merge GROUP BY new_id
+        ) d
+        WHERE albums.id = d.new_id
+    """)
+    op.execute("DROP TABLE album_merge")
+
+
+def _merge_duplicate_songs() -> None:
+    # (title, artist_id)가 같은 곡은 가장 작은 id로 합치고 플레이리스트/좋아요/추천이 남은 곡을 가리키도록 변경
+    op.execute("""
+        CREATE TEMPORARY TABLE song_merge AS
+        SELECT old_id, new_id, spotify_id, duration_ms, preview_url, album_id
+        FROM (
+            SELECT id AS old_id, MIN(id) OVER (PARTITION BY title, artist_id) AS new_id,
+                   spotify_id, duration_ms, preview_url, album_id
+            FROM songs
+        ) ranked
+        WHERE old_id <> new_id
+    """)
+    op.execute("UPDATE playlist_songs SET song_id = m.new_id FROM song_merge m WHERE playlist_songs.song_id = m.old_id")
+
+    # 기본 키에 song_id가 포함된 테이블은 합친 결과가 겹치지 않도록 새로 넣고 기존 행 삭제
+    op.execute("""
+        INSERT INTO user_liked_songs (user_id, song_id, liked_at)
+        SELECT l.user_id, m.new_id, MIN(l.liked_at)
+        FROM user_liked_songs l JOIN song_merge m ON l.song_id = m.old_id
+        GROUP BY l.user_id, m.new_id
+        ON CONFLICT DO NOTHING
+    """)
+    op.execute("DELETE FROM user_liked_songs USING song_merge m WHERE user_liked_songs.song_id = m.old_id")
+    op.execute("""
+        INSERT INTO recommended_songs (user_id, artist_id, song_id)
+        SELECT r.user_id, MIN(r.artist_id), m.new_id
+        FROM recommended_songs r JOIN song_merge m ON r.song_id = m.old_id
+        GROUP BY r.user_id, m.new_id
+        ON CONFLICT DO NOTHING
+    """)
+    op.execute("DELETE FROM recommended_songs USING song_merge m WHERE recommended_songs.song_id = m.old_id")
+
+    op.execute("DELETE FROM songs USING song_merge m WHERE songs.id = m.old_id")
+    op.execute("""
+        UPDATE songs SET
+            spotify_id = COALESCE(songs.spotify_id, d.spotify_id),
+            duration_ms = COALESCE(songs.duration_ms, d.duration_ms),
+            preview_url = COALESCE(songs.preview_url, d.preview_url),
+            album_id = COALESCE(songs.album_id, d.album_id)
+        FROM (
+            SELECT new_id, MIN(spotify_id) AS spotify_id, MAX(duration_ms) AS duration_ms,
+                   MIN(preview_url) AS preview_url, MIN(album_id) AS album_id
+            FROM song_merge GROUP BY new_id
+        ) d
+        WHERE songs.id = d.new_id
+    """)
+    op.execute("DROP TABLE song_merge")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 이전 save_track_to_db(조회 후 삽입)로 생긴 (title, artist_id) 중복을 먼저 합침
+    # 앨범을 먼저 합쳐야 곡의 album_id가 남은 앨범을 가리킨 상태로 곡을 합칠 수 있음
+    _merge_duplicate_albums()
+    _merge_duplicate_songs()
+
+    # bulk upsert(INSERT ... ON CONFLICT)의 충돌 대상 키
+    op.create_unique_constraint('uq_albums_title_artist', 'albums', ['title', 'artist_id'])
+    op.create_unique_constraint('uq_songs_title_artist', 'songs', ['title', 'artist_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 합친 중복 행은 복원하지 않음
+    op.drop_constraint('uq_songs_title_artist', 'songs', type_='unique')
+    op.drop_constraint('uq_albums_title_artist', 'albums', type_='unique')
@@ -0,0 +1,43 @@
+"""add spotify track cache
+
+Revision ID: c81d4e6f2a17
+Revises: b52e7d10c6a9
+Create Date: 2026-10-18 11:47:02.915364
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81d4e6f2a17'
+down_revision: Union[str, None] = 'b52e7d10c6a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'spotify_track_cache',
+        sa.Column('cache_key', sa.Text(), nullable=False),
+        sa.Column('spotify_id', sa.String(length=50), nullable=True),
+        sa.Column('duration_ms', sa.Integer(), nullable=True),
+        sa.Column('preview_url', sa.String(length=255), nullable=True),
+        sa.Column('album_name', sa.Text(), nullable=True),
+        sa.Column('album_spotify_id', sa.String(length=50), nullable=True),
+        sa.Column('album_image', sa.String(length=255), nullable=True),
+        sa.Column('artist_spotify_id', sa.String(length=50), nullable=True),
+        sa.Column('fetched_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('cache_key')
+    )
+    op.create_index(op.f('ix_spotify_track_cache_expires_at'), 'spotify_track_cache', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_spotify_track_cache_expires_at'), table_name='spotify_track_cache')
+    op.drop_table('spotify_track_cache')
@@ -0,0 +1,28 @@
+"""add spotify track cache status
+
+Revision ID: e4a9b3c75d21
+Revises: c81d4e6f2a17
+Create Date: 2026-10-18 12:26:45.730918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a9b3c75d21'
+down_revision: Union[str, None] = 'c81d4e6f2a17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('spotify_track_cache', sa.Column('status', sa.String(length=20), server_default='found', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('spotify_track_cache', 'status')
@@ -0,0 +1,36 @@
+"""add artist metadata
+
+Revision ID: f3b8c62d1e95
+Revises: a6d02f9e4b17
+Create Date: 2026-10-18 15:03:12.774620
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8c62d1e95'
+down_revision: Union[str, None] = 'a6d02f9e4b17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('artists', sa.Column('genres', sa.JSON(), nullable=True))
+    op.add_column('artists', sa.Column('popularity', sa.Integer(), nullable=True))
+    op.add_column('artists', sa.Column('followers', sa.Integer(), nullable=True))
+    op.add_column('artists', sa.Column('fetched_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index(op.f('ix_artists_fetched_at'), 'artists', ['fetched_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_artists_fetched_at'), table_name='artists')
+    op.drop_column('artists', 'fetched_at')
+    op.drop_column('artists', 'followers')
+    op.drop_column('artists', 'popularity')
+    op.drop_column('artists', 'genres')
@@ -0,0 +1,80 @@
+"""
+앨범 트랙 로딩 벤치마크 (user-013)
+- 로컬 스텁 Spotify가 --tracks곡짜리 앨범을 제공 (요청당 --latency초)
+- before: 트랙 페이지를 하나씩 순서대로 가져온 뒤 앨범 정보 조회 (N+1번 순차 왕복)
+- after : /albums/{id} 응답의 첫 페이지 사용 + 나머지 페이지 동시 조회 (Api.album_service)
+- 두 방식 모두 같은 방법으로 song_id를 저장하므로 로컬 Postgres 필요 (POSTGRESQL_* 환경 변수)
+
+실행: cd Back && python -m bench.album_loading --tracks 200 --latency 0.1
+"""
+import argparse
+import asyncio
+import time
+from bench.stub_upstream import StubUpstream, configure_env, setup_database
+
+
+async def main(args) -> None:
+    stub = StubUpstream(latency=args.latency, album_tracks=args.tracks)
+    base_url = stub.start_in_thread()
+    configure_env(base_url)
+    await setup_database()
+
+    from core import database
+    from core.http_client import start_http_clients, close_http_clients
+    from core.spotify_scheduler import spotify_scheduler, INTERACTIVE
+    from core.spotify_token import spotify_tokens
+    from Api.album_service import ALBUM_TRACKS_PAGE_SIZE, _fetch_and_save
+    from Api.crud import resolve_song_ids
+
+    async def load_serial(album_id: str) -> int:
+        # 이전 get_album_tracks: 페이지를 하나씩 가져온 뒤 앨범 정보 조회
+        tracks, offset = [], 0
+        while True:
+            response = await spotify_scheduler.request(
+                'GET', f'/albums/{album_id}/tracks',
+                params={'limit': ALBUM_TRACKS_PAGE_SIZE, 'offset': offset}, priority=INTERACTIVE
+            )
+            items = response.data.get('items', [])
+            tracks.extend(items)
+            if len(items) < ALBUM_TRACKS_PAGE_SIZE:
+                break
+            offset += ALBUM_TRACKS_PAGE_SIZE
+        album = (await spotify_scheduler.request('GET', f'/albums/{album_id}', priority=INTERACTIVE)).data
+
+        async with database.DBSessionLocal() as db:
+            await resolve_song_ids(db, [
+                {'title': track['name'], 'artist': track['artists'][0]['name'], 'album': album['name'],
+                 'duration_ms': track.get('duration_ms'), 'spotify_id': track.get('id')}
+                for track in tracks
+            ], "spotify")
+            await db.commit()
+        return len(tracks)
+
+    async def load_concurrent(album_id: str) -> int:
+        async with database.DBSessionLocal() as db:
+            _, track_list = await _fetch_and_save(db, album_id)
+            await db.commit()
+        return len(track_list)
+
+    await start_http_clients()
+    try:
+        await spotify_tokens.get_token()
+        run_id = time.time_ns()
+        for name, loader in (("before (serial pages)", load_serial), ("after (concurrent pages)", load_concurrent)):
+            hits_before = sum(stub.hits.values())
+            started = time.perf_counter()
+            # 실행마다 다른 앨범 ID를 사용해 두 방식 모두 새 트랙을 저장하도록 함
+            count = await loader(f"bench{run_id}{name[:5]}")
+            elapsed = time.perf_counter() - started
+            print(f"  {name:26}: {elapsed:6.3f}s ({elapsed / args.latency:4.1f} x latency) "
+                  f"round_trips={sum(stub.hits.values()) - hits_before} tracks={count}")
+    finally:
+        await close_http_clients()
+        stub.stop_thread()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tracks", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.1, help="스텁 서버 응답 지연 (초)")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,49 @@
+import json
+from typing import Dict, Optional, Tuple
+
+
+async def asgi_request(
+    app,
+    method: str,
+    path: str,
+    headers: Optional[Dict[str, str]] = None,
+    json_body: Optional[dict] = None
+) -> Tuple[int, bytes]:
+    """ASGI 앱에 요청을 직접 보내 (상태 코드, 본문) 반환 (HTTP 서버/클라이언트 없이 앱 처리 시간만 측정)"""
+    body = json.dumps(json_body).encode() if json_body is not None else b""
+    headers = {**(headers or {}), **({"content-type": "application/json"} if json_body is not None else {})}
+    path, _, query_string = path.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method.upper(),
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query_string.encode(),
+        "root_path": "",
+        "headers": [(key.lower().encode(), value.encode()) for key, value in headers.items()],
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+    status = None
+    chunks = []
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if sent:
+            return {"type": "http.disconnect"}
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, b"".join(chunks)
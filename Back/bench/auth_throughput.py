@@ -0,0 +1,69 @@
+"""
+인증 요청 처리량 벤치마크 (user-019)
+- 앱(main.app)에 GET /users/me 요청을 ASGI로 직접 보내 초당 요청 수 비교
+- before: 인증 사용자 캐시를 건너뛰어 요청마다 사용자 조회 SELECT 실행 (이전 get_current_user)
+- after : 인증 사용자 캐시 사용 (캐시가 채워진 뒤에는 사용자 조회 없음)
+- 로컬 Postgres 필요 (POSTGRESQL_* 환경 변수, DB_SSL_MODE=disable)
+
+실행: cd Back && python -m bench.auth_throughput --requests 2000 --concurrency 20
+"""
+import argparse
+import asyncio
+import time
+from bench.asgi import asgi_request
+from bench.stub_upstream import configure_env, setup_database
+
+
+async def run(app, requests: int, concurrency: int, headers: dict) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with semaphore:
+            status, body = await asgi_request(app, "GET", "/users/me", headers)
+            if status != 200:
+                raise RuntimeError(f"GET /users/me failed: {status} {body[:200]}")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return time.perf_counter() - started
+
+
+async def main(args) -> None:
+    # 외부 API는 호출하지 않지만 실제 Spotify로 나가지 않도록 설정
+    configure_env("http://127.0.0.1:9")
+    await setup_database()
+
+    from sqlalchemy import delete
+    from core import database
+    from core.dependencies import create_jwt
+    from core.models import User
+    from User import user_router
+    from main import app
+
+    async with database.DBSessionLocal() as db:
+        await db.execute(delete(User).where(User.username == "bench_auth"))
+        user = User(username="bench_auth", email="bench_auth@example.com", hashed_password="-")
+        db.add(user)
+        await db.commit()
+        user_id = user.id
+
+    headers = {"Authorization": f"Bearer {create_jwt(data={'sub': str(user_id)})}"}
+    get_cached_principal = user_router.get_cached_principal
+
+    # 캐시를 건너뛰면 요청마다 사용자 조회
+    user_router.get_cached_principal = lambda user_id, token: None
+    before = await run(app, args.requests, args.concurrency, headers)
+
+    user_router.get_cached_principal = get_cached_principal
+    after = await run(app, args.requests, args.concurrency, headers)
+
+    print(f"GET /users/me requests={args.requests} concurrency={args.concurrency}")
+    print(f"  before (user SELECT per request): {args.requests / before:8.1f} req/s")
+    print(f"  after  (principal cache)        : {args.requests / after:8.1f} req/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
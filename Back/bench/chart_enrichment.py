@@ -0,0 +1,58 @@
+"""
+차트 Spotify 상세 정보 조회 벤치마크 (user-001)
+- 로컬 스텁 Spotify 서버(요청당 --latency초)에 100곡 차트를 조회
+- 트랙마다 순서대로 조회(이전 방식) vs 동시 조회(track_resolver)의 소요 시간 비교
+
+실행: cd Back && python -m bench.chart_enrichment --tracks 100 --latency 0.05 --concurrency 10
+"""
+import argparse
+import asyncio
+import time
+from bench.stub_upstream import StubUpstream, configure_env
+
+
+async def main(args) -> None:
+    stub = StubUpstream(latency=args.latency)
+    base_url = stub.start_in_thread()
+    configure_env(base_url, SPOTIFY_ENRICH_CONCURRENCY=str(args.concurrency))
+
+    # 환경 변수 설정 후에 앱 모듈 import
+    from core.http_client import start_http_clients, close_http_clients
+    from core.spotify_scheduler import BACKGROUND
+    from core.spotify_token import spotify_tokens
+    from Api.spotify_service import fetch_spotify_track_details
+    from Api.track_resolver import _fetch_from_spotify
+
+    pairs = [(f"Chart Track {i}", f"Chart Artist {i}") for i in range(args.tracks)]
+
+    await start_http_clients()
+    try:
+        # 토큰 발급은 측정에서 제외
+        await spotify_tokens.get_token()
+
+        # 이전 방식: 트랙마다 응답을 기다린 뒤 다음 트랙 조회
+        started = time.perf_counter()
+        for track_name, artist_name in pairs:
+            await fetch_spotify_track_details(track_name, artist_name, BACKGROUND)
+        serial = time.perf_counter() - started
+
+        started = time.perf_counter()
+        results = await _fetch_from_spotify(pairs, BACKGROUND)
+        concurrent = time.perf_counter() - started
+    finally:
+        await close_http_clients()
+        stub.stop_thread()
+
+    found = sum(1 for status, _ in results if status == 'found')
+    print(f"tracks={args.tracks} latency={args.latency * 1000:.0f}ms concurrency={args.concurrency} found={found}")
+    print(f"  serial     : {serial:7.3f}s ({serial / args.latency:6.1f} x latency)")
+    print(f"  concurrent : {concurrent:7.3f}s ({concurrent / args.latency:6.1f} x latency)")
+    print(f"  speedup    : {serial / concurrent:7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tracks", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05, help="스텁 서버 응답 지연 (초)")
+    parser.add_argument("--concurrency", type=int, default=10, help="SPOTIFY_ENRICH_CONCURRENCY")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,65 @@
+"""
+외부 API 호출 처리량 벤치마크 (user-006)
+- 로컬 스텁 업스트림(요청당 --latency초)에 --requests개의 요청을 보내 초당 요청 수 비교
+- before: 이전 방식 - 호출마다 requests.get (연결 재사용 없음, 이벤트 루프를 막아 한 번에 하나씩)
+- after : core.http_client 공유 세션 (keep-alive 풀) + --concurrency개 동시 요청
+
+실행: cd Back && python -m bench.http_throughput --requests 500 --latency 0.01 --concurrency 20
+"""
+import argparse
+import asyncio
+import time
+import requests
+from bench.stub_upstream import StubUpstream, configure_env
+
+
+async def main(args) -> None:
+    stub = StubUpstream(latency=args.latency)
+    base_url = stub.start_in_thread()
+    configure_env(base_url)
+
+    from core.http_client import request, start_http_clients, close_http_clients
+
+    url = f"{base_url}/v1/search"
+    params = {'q': 'bench', 'type': 'track', 'limit': 1}
+    results = {}
+
+    # before: async 핸들러 안에서 블로킹 requests.get 호출
+    started = time.perf_counter()
+    for _ in range(args.requests):
+        requests.get(url, params=params, timeout=10).json()
+    results['before (requests.get)'] = time.perf_counter() - started
+
+    await start_http_clients()
+    try:
+        # after (순차): 연결 재사용 효과만 측정
+        started = time.perf_counter()
+        for _ in range(args.requests):
+            await request('spotify_api', 'GET', url, params=params)
+        results['after, sequential'] = time.perf_counter() - started
+
+        # after (동시): 이벤트 루프를 막지 않으므로 요청을 겹쳐서 보냄
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def one() -> None:
+            async with semaphore:
+                await request('spotify_api', 'GET', url, params=params)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(args.requests)))
+        results[f'after, concurrency={args.concurrency}'] = time.perf_counter() - started
+    finally:
+        await close_http_clients()
+        stub.stop_thread()
+
+    print(f"requests={args.requests} latency={args.latency * 1000:.0f}ms")
+    for name, elapsed in results.items():
+        print(f"  {name:28}: {args.requests / elapsed:8.1f} req/s ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.01, help="스텁 서버 응답 지연 (초)")
+    parser.add_argument("--concurrency", type=int, default=20, help="HTTP_POOL_SIZE_PER_HOST 이하 권장")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,106 @@
+"""
+로그인 폭주 벤치마크 (user-020)
+- --logins개의 로그인을 동시에 계속 보내는 동안 다른 엔드포인트(GET /users/me)의 응답 시간 측정
+- before: bcrypt를 이벤트 루프에서 직접 실행 (이전 방식 - 해싱 중에는 모든 요청이 멈춤)
+- after : bcrypt를 전용 스레드 풀에서 실행 (core.dependencies)
+- 로컬 Postgres 필요 (POSTGRESQL_* 환경 변수, DB_SSL_MODE=disable)
+
+실행: cd Back && python -m bench.login_storm --logins 32 --duration 5
+"""
+import argparse
+import asyncio
+import math
+import statistics
+import time
+from bench.asgi import asgi_request
+from bench.stub_upstream import configure_env, setup_database
+
+EMAIL = "bench_login@example.com"
+PASSWORD = "bench-password"
+
+
+async def probe_latencies(app, headers: dict, duration: float) -> list:
+    """
+    duration초 동안 10ms 간격으로 GET /users/me를 보내 응답 시간 수집
+    - 보내려던 시각부터 재므로 이벤트 루프가 막혀 요청을 늦게 시작한 시간도 포함
+    """
+    latencies = []
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        scheduled = time.perf_counter() + 0.01
+        await asyncio.sleep(0.01)
+        status, _ = await asgi_request(app, "GET", "/users/me", headers)
+        latencies.append(time.perf_counter() - scheduled)
+        if status != 200:
+            raise RuntimeError(f"GET /users/me failed: {status}")
+    return latencies
+
+async def login_storm(app, logins: int, stop: asyncio.Event) -> int:
+    count = 0
+
+    async def worker() -> None:
+        nonlocal count
+        while not stop.is_set():
+            status, _ = await asgi_request(app, "POST", "/users/login", json_body={"email": EMAIL, "password": PASSWORD})
+            count += status == 200
+
+    await asyncio.gather(*(worker() for _ in range(logins)))
+    return count
+
+async def measure(app, headers: dict, logins: int, duration: float):
+    stop = asyncio.Event()
+    storm = asyncio.create_task(login_storm(app, logins, stop)) if logins else None
+    await asyncio.sleep(0.2 if storm else 0)
+    latencies = await probe_latencies(app, headers, duration)
+    stop.set()
+    completed = await storm if storm else 0
+    return latencies, completed
+
+def summarize(name: str, latencies: list, logins_completed: int) -> None:
+    ordered = sorted(latencies)
+    p95 = ordered[math.ceil(len(ordered) * 0.95) - 1]
+    print(f"  {name:24}: p50={statistics.median(ordered) * 1000:7.1f}ms p95={p95 * 1000:7.1f}ms "
+          f"max={ordered[-1] * 1000:7.1f}ms probes={len(ordered)} logins={logins_completed}")
+
+
+async def main(args) -> None:
+    configure_env("http://127.0.0.1:9", PASSWORD_MAX_PENDING=str(max(64, args.logins)))
+    await setup_database()
+
+    from sqlalchemy import delete
+    from core import database, dependencies
+    from core.models import User
+    from main import app
+
+    async with database.DBSessionLocal() as db:
+        await db.execute(delete(User).where(User.email == EMAIL))
+        user = User(username="bench_login", email=EMAIL, hashed_password=await dependencies.hash_password(PASSWORD))
+        db.add(user)
+        await db.commit()
+        user_id = user.id
+
+    headers = {"Authorization": f"Bearer {dependencies.create_jwt(data={'sub': str(user_id)})}"}
+    await asgi_request(app, "GET", "/users/me", headers)  # 인증 사용자 캐시 채우기
+
+    print(f"GET /users/me latency during {args.logins} concurrent logins (bcrypt rounds={dependencies.config.bcrypt_rounds})")
+    summarize("idle", *await measure(app, headers, 0, args.duration))
+
+    # before: 이벤트 루프에서 bcrypt 실행
+    run_password_task = dependencies._run_password_task
+
+    async def run_inline(func, *func_args):
+        return func(*func_args)
+
+    dependencies._run_password_task = run_inline
+    summarize("storm, inline bcrypt", *await measure(app, headers, args.logins, args.duration))
+
+    dependencies._run_password_task = run_password_task
+    summarize("storm, password pool", *await measure(app, headers, args.logins, args.duration))
+    dependencies.shutdown_password_pool()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=32, help="동시 로그인 수")
+    parser.add_argument("--duration", type=float, default=5, help="측정 시간 (초)")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,86 @@
+"""
+읽기 replica 라우팅 확인 (user-021)
+- primary(POSTGRESQL_*)와 스트리밍 replica(POSTGRESQL_REPLICA_ENDPOINT/PORT) 두 로컬 Postgres가 필요
+- 읽기 세션은 replica, 쓰기 세션은 primary로 가는지, 쓰기(가입 포함) 직후에는 읽기도 primary로 가는지 확인
+- get_current_user가 요청 내내 커넥션을 잡고 있지 않은지 확인
+
+로컬 replica 예시:
+  pg_basebackup -h <primary> -D /tmp/replica -R -X stream
+  pg_ctl -D /tmp/replica -o "-p 5433" start
+
+실행: cd Back && DB_STICKY_PRIMARY_SECONDS=1 python -m bench.replica_routing
+"""
+import asyncio
+import json
+import os
+import time
+from jose import jwt
+from bench.asgi import asgi_request
+from bench.stub_upstream import configure_env, setup_database
+
+failures = []
+
+def check(name: str, ok: bool, detail: str = "") -> None:
+    print(f"  {'PASS' if ok else 'FAIL'} {name} {detail}")
+    if not ok:
+        failures.append(name)
+
+
+async def main() -> int:
+    if not os.environ.get('POSTGRESQL_REPLICA_ENDPOINT'):
+        raise SystemExit("Set POSTGRESQL_REPLICA_ENDPOINT/PORT to a streaming replica of the primary")
+
+    configure_env("http://127.0.0.1:9")
+    await setup_database()
+
+    from sqlalchemy import text
+    from core import database
+    from core.config import get_config
+    from User.user_router import get_current_user
+    from main import app
+
+    sticky_seconds = float(get_config().db_sticky_primary_seconds)
+
+    async def read_target(user_id=None) -> str:
+        token = database.current_user_id.set(user_id)
+        try:
+            async with database.ReadSessionLocal() as db:
+                in_recovery = (await db.execute(text("SELECT pg_is_in_recovery()"))).scalar()
+        finally:
+            database.current_user_id.reset(token)
+        return "replica" if in_recovery else "primary"
+
+    async with database.DBSessionLocal() as db:
+        in_recovery = (await db.execute(text("SELECT pg_is_in_recovery()"))).scalar()
+    check("write session uses primary", not in_recovery)
+    check("read session uses replica", await read_target() == "replica")
+
+    # 가입 직후 첫 인증 요청 (replica에 아직 없어도 401이 나면 안 됨)
+    name = f"replica{time.time_ns()}"
+    status, body = await asgi_request(app, "POST", "/users/register", json_body={
+        "username": name, "email": f"{name}@example.com", "password": "replica-password"
+    })
+    check("register", status == 201, str(status))
+    status, body = await asgi_request(app, "POST", "/users/login", json_body={
+        "email": f"{name}@example.com", "password": "replica-password"
+    })
+    token = json.loads(body)["access_token"]
+    user_id = int(jwt.get_unverified_claims(token)["sub"])
+    check("reads right after register use primary", await read_target(user_id) == "primary")
+
+    status, _ = await asgi_request(app, "GET", "/users/me", {"Authorization": f"Bearer {token}"})
+    check("first authenticated request after register", status == 200, str(status))
+
+    # get_current_user는 조회가 끝나면 커넥션을 반납해야 함
+    await get_current_user(token=token)
+    in_use = {name: stats['in_use'] for name, stats in database.get_pool_stats().items()}
+    check("get_current_user releases its connection", not any(in_use.values()), str(in_use))
+
+    await asyncio.sleep(sticky_seconds + 0.5)
+    check("reads go back to replica after the sticky window", await read_target(user_id) == "replica")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
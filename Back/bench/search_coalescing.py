@@ -0,0 +1,53 @@
+"""
+동일 검색 동시 요청 부하 테스트 (user-009)
+- 같은 검색어로 N개 요청을 동시에 보내고, 스텁 Spotify의 /search 호출 수가 N과 관계없이 1인지 확인
+- song_id 저장을 위해 로컬 Postgres 필요 (POSTGRESQL_* 환경 변수, DB_SSL_MODE=disable)
+
+실행: cd Back && python -m bench.search_coalescing --levels 1,10,100,500 --latency 0.2
+"""
+import argparse
+import asyncio
+import time
+from bench.stub_upstream import StubUpstream, configure_env, setup_database
+
+
+async def main(args) -> int:
+    stub = StubUpstream(latency=args.latency)
+    base_url = stub.start_in_thread()
+    configure_env(base_url)
+    await setup_database()
+
+    from core.http_client import start_http_clients, close_http_clients
+    from Api.search_service import search_spotify, search_flights
+
+    failures = 0
+    await start_http_clients()
+    try:
+        for level in args.levels:
+            # 수준마다 다른 검색어를 사용해 응답 캐시가 아닌 in-flight 합치기만 측정
+            query = f"trending {level} {time.time_ns()}"
+            hits_before = stub.hits['search']
+            shared_before = search_flights.stats()['shared']
+
+            started = time.perf_counter()
+            results = await asyncio.gather(*(search_spotify(query) for _ in range(level)))
+            elapsed = time.perf_counter() - started
+
+            upstream_calls = stub.hits['search'] - hits_before
+            shared = search_flights.stats()['shared'] - shared_before
+            ok = upstream_calls == 1 and all(result is results[0] for result in results)
+            failures += not ok
+            print(f"  concurrent={level:5d} upstream_calls={upstream_calls} shared={shared:5d} "
+                  f"elapsed={elapsed:.3f}s {'OK' if ok else 'FAIL'}")
+    finally:
+        await close_http_clients()
+        stub.stop_thread()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--levels", type=lambda value: [int(level) for level in value.split(',')], default=[1, 10, 100, 500])
+    parser.add_argument("--latency", type=float, default=0.2, help="스텁 서버 응답 지연 (초)")
+    raise SystemExit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,224 @@
+import asyncio
+import hashlib
+import os
+import string
+import threading
+from collections import Counter
+from typing import Optional, Set
+from aiohttp import web
+
+# Spotify ID 형식 (22자 base62) - 형식이 다른 ID가 섞이면 Spotify처럼 요청 전체를 400으로 거절
+_BASE62 = set(string.ascii_letters + string.digits)
+
+def is_spotify_id(value: str) -> bool:
+    return len(value) == 22 and set(value) <= _BASE62
+
+def fake_spotify_id(seed: str) -> str:
+    """시드 문자열로 만든 22자 가짜 Spotify ID"""
+    alphabet = string.ascii_letters + string.digits
+    number = int(hashlib.sha1(seed.encode('utf-8')).hexdigest(), 16)
+    chars = []
+    for _ in range(22):
+        number, index = divmod(number, len(alphabet))
+        chars.append(alphabet[index])
+    return "".join(chars)
+
+
+class StubUpstream:
+    """
+    벤치마크용 로컬 Spotify/Last.fm 대역 서버
+    - 모든 응답에 latency초 지연을 넣어 실제 외부 API 왕복 시간을 흉내냄
+    - 경로별 호출 수(hits)를 기록해 업스트림 호출이 몇 번 나갔는지 확인
+    """
+
+    def __init__(self, latency: float = 0.05, album_tracks: int = 200, chart_tracks: int = 100):
+        self.latency = latency
+        self.album_tracks = album_tracks
+        self.chart_tracks = chart_tracks
+        self.missing_artist_ids: Set[str] = set()  # /artists?ids= 에서 null로 반환할 ID
+        self.hits: Counter = Counter()
+        self._runner: Optional[web.AppRunner] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+        self.app = web.Application()
+        self.app.router.add_post('/api/token', self._token)
+        self.app.router.add_get('/v1/search', self._search)
+        self.app.router.add_get('/v1/albums/{album_id}', self._album)
+        self.app.router.add_get('/v1/albums/{album_id}/tracks', self._album_tracks)
+        self.app.router.add_get('/v1/artists', self._artists)
+        self.app.router.add_get('/lastfm/', self._lastfm)
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """서버 시작 후 기본 URL 반환 (port=0이면 빈 포트 사용)"""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return f"http://{host}:{port}"
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def start_in_thread(self) -> str:
+        """별도 스레드의 이벤트 루프에서 서버 시작 (측정 대상 이벤트 루프와 분리, 블로킹 클라이언트도 사용 가능)"""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        return asyncio.run_coroutine_threadsafe(self.start(), self._loop).result()
+
+    def stop_thread(self) -> None:
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+
+    async def _delay(self, name: str) -> None:
+        self.hits[name] += 1
+        await asyncio.sleep(self.latency)
+
+    async def _token(self, request: web.Request) -> web.Response:
+        await self._delay('token')
+        return web.json_response({'access_token': 'bench-token', 'token_type': 'Bearer', 'expires_in': 3600})
+
+    def _track(self, name: str, artist: str, index: int = 0) -> dict:
+        return {
+            'id': fake_spotify_id(f"track:{name}:{artist}"),
+            'name': name,
+            'artists': [{'id': fake_spotify_id(f"artist:{artist}"), 'name': artist}],
+            'album': {
+                'id': fake_spotify_id(f"album:{artist}"),
+                'name': f"{artist} Album",
+                'images': [{'url': f"https://images.example/{index}.jpg", 'height': 300}],
+            },
+            'duration_ms': 180000 + index,
+            'preview_url': None,
+            'track_number': index + 1,
+            'disc_number': 1,
+            'external_urls': {'spotify': f"https://open.spotify.example/track/{index}"},
+        }
+
+    async def _search(self, request: web.Request) -> web.Response:
+        await self._delay('search')
+        query = request.query.get('q', '')
+        types = request.query.get('type', 'track').split(',')
+        limit = int(request.query.get('limit', 10))
+
+        data = {}
+        if 'track' in types:
+            data['tracks'] = {'items': [self._track(f"{query} {i}", f"{query} Artist", i) for i in range(limit)]}
+        if 'album' in types:
+            data['albums'] = {'items': [
+                {'id': fake_spotify_id(f"album:{query}:{i}"), 'name': f"{query} Album {i}", 'artists': [{'name': query}],
+                 'images': [{'url': f"https://images.example/album{i}.jpg", 'height': 300}]}
+                for i in range(limit)
+            ]}
+        if 'artist' in types:
+            data['artists'] = {'items': [
+                {'id': fake_spotify_id(f"artist:{query}:{i}"), 'name': f"{query} {i}", 'genres': [], 'followers': {'total': i},
+                 'images': [{'url': f"https://images.example/artist{i}.jpg"}]}
+                for i in range(limit)
+            ]}
+        return web.json_response(data)
+
+    def _album_page(self, album_id: str, offset: int, limit: int) -> dict:
+        end = min(offset + limit, self.album_tracks)
+        return {
+            'items': [self._track(f"{album_id} Track {i}", "Box Set Artist", i) for i in range(offset, end)],
+            'total': self.album_tracks,
+            'offset': offset,
+            'limit': limit,
+        }
+
+    async def _album(self, request: web.Request) -> web.Response:
+        await self._delay('album')
+        album_id = request.match_info['album_id']
+        return web.json_response({
+            'id': album_id,
+            'name': f"{album_id} Box Set",
+            'artists': [{'name': "Box Set Artist"}],
+            'release_date': '2020-01-01',
+            'total_tracks': self.album_tracks,
+            'images': [{'url': 'https://images.example/album.jpg'}],
+            # 실제 Spotify처럼 첫 페이지(최대 50곡)를 포함
+            'tracks': self._album_page(album_id, 0, 50),
+        })
+
+    async def _album_tracks(self, request: web.Request) -> web.Response:
+        await self._delay('album_tracks')
+        offset = int(request.query.get('offset', 0))
+        limit = int(request.query.get('limit', 20))
+        return web.json_response(self._album_page(request.match_info['album_id'], offset, limit))
+
+    async def _artists(self, request: web.Request) -> web.Response:
+        await self._delay('artists')
+        ids = request.query.get('ids', '').split(',')
+        if not all(is_spotify_id(artist_id) for artist_id in ids):
+            return web.json_response({'error': {'status': 400, 'message': 'invalid id'}}, status=400)
+
+        return web.json_response({'artists': [
+            None if artist_id in self.missing_artist_ids else {
+                'id': artist_id,
+                'name': f"Artist {artist_id[:6]}",
+                'images': [{'url': f"https://images.example/{artist_id}.jpg"}],
+                'genres': ['bench'],
+                'popularity': 50,
+                'followers': {'total': 1000},
+            }
+            for artist_id in ids
+        ]})
+
+    async def _lastfm(self, request: web.Request) -> web.Response:
+        await self._delay('lastfm')
+        return web.json_response({'tracks': {'track': [
+            {
+                'name': f"Chart Track {i}",
+                'artist': {'name': f"Chart Artist {i}", 'mbid': '', 'url': ''},
+                'playcount': str(1000 - i),
+                'listeners': str(500 - i),
+                'mbid': '',
+                'url': f"https://last.fm.example/{i}",
+            }
+            for i in range(self.chart_tracks)
+        ]}})
+
+
+def configure_env(base_url: str, **overrides: str) -> None:
+    """
+    앱 모듈이 스텁 서버를 바라보도록 환경 변수 설정
+    - core.config는 import 시점에 환경 변수를 읽으므로 앱 모듈 import 전에 호출해야 함
+    - 속도 제한은 벤치마크 측정에 끼어들지 않도록 크게 설정
+    """
+    os.environ.update({
+        'SPOTIFY_API_URL': f"{base_url}/v1",
+        'SPOTIFY_ACCOUNTS_URL': base_url,
+        'LASTFM_API_URL': f"{base_url}/lastfm/",
+        'SpotifyAPIKEY': 'bench',
+        'SpotifySecretKey': 'bench',
+        'LastfmAPIKEY': 'bench',
+        'SPOTIFY_RATE_LIMIT': '10000',
+        'SPOTIFY_RATE_BURST': '10000',
+        **overrides,
+    })
+
+async def setup_database() -> None:
+    """
+    POSTGRESQL_* 환경 변수의 로컬 Postgres에 연결하고 테이블 생성 (DB가 필요한 벤치마크용)
+    - 운영 DB를 가리키지 않도록 POSTGRESQL_ENDPOINT를 명시적으로 설정해야 함
+    """
+    if not os.environ.get('POSTGRESQL_ENDPOINT'):
+        raise SystemExit("Set POSTGRESQL_ENDPOINT/PORT/TABLE/USER/PASSWORD (and DB_SSL_MODE=disable) to a local Postgres")
+
+    from core import database
+    from core.config import get_config
+    from core.models import Base  # 모델 import로 테이블 메타데이터 등록
+
+    database.init_db(get_config())
+    async with database.db_engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
@@ -1,5 +1,6 @@
 import os
 from functools import lru_cache
+from typing import Optional
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
@@ -13,14 +14,104 @@ class DefaultConfig(BaseSettings):
     postgresql_user: str = os.getenv("POSTGRESQL_USER")
     postgresql_password: str = os.getenv("POSTGRESQL_PASSWORD")
 
+    # 읽기 전용 replica (비워 두면 읽기 세션도 primary 사용)
+    postgresql_replica_endpoint: Optional[str] = os.getenv("POSTGRESQL_REPLICA_ENDPOINT")
+    postgresql_replica_port: Optional[int] = os.getenv("POSTGRESQL_REPLICA_PORT")
+    # 사용자가 쓰기를 한 뒤 이 시간(초) 동안은 읽기도 primary에서 수행
+    db_sticky_primary_seconds: float = os.getenv("DB_STICKY_PRIMARY_SECONDS", 5)
+
+    # DB 커넥션 풀 설정
+    db_pool_size: int = os.getenv("DB_POOL_SIZE", 10)
+    db_max_overflow: int = os.getenv("DB_MAX_OVERFLOW", 10)
+    db_pool_timeout: float = os.getenv("DB_POOL_TIMEOUT", 30)
+    db_pool_recycle: int = os.getenv("DB_POOL_RECYCLE", 1800)
+    db_pool_pre_ping: bool = os.getenv("DB_POOL_PRE_PING", True)
+    db_statement_cache_size: int = os.getenv("DB_STATEMENT_CACHE_SIZE", 100)
+    # SSL 설정 (disable / require: 검증 없이 암호화 / verify: 인증서 검증)
+    db_ssl_mode: str = os.getenv("DB_SSL_MODE", "require")
+    db_ssl_ca_file: Optional[str] = os.getenv("DB_SSL_CA_FILE")
+
+    # 앱 시작 설정 (미리 열어 둘 DB 커넥션 수, 준비 완료 전에 스냅샷 캐시 채우기 여부)
+    db_warmup_connections: int = os.getenv("DB_WARMUP_CONNECTIONS", 5)
+    startup_prime_caches: bool = os.getenv("STARTUP_PRIME_CACHES", False)
+
     jwt_secret_key: str = os.getenv(
         "JWT_SECRET_KEY"
     )
     jwt_expire_minutes: int = os.getenv("JWT_TOKEN_EXPIRE_MINUTES", 600)
+
+    # 비밀번호 해싱 설정 (bcrypt cost, 전용 스레드 풀 크기, 최대 대기 작업 수)
+    bcrypt_rounds: int = os.getenv("BCRYPT_ROUNDS", 12)
+    password_pool_size: int = os.getenv("PASSWORD_POOL_SIZE", 4)
+    password_max_pending: int = os.getenv("PASSWORD_MAX_PENDING", 64)
+
     LastfmAPIKEY:str = os.getenv("LastfmAPIKEY")
     SpotifyAPIKEY:str = os.getenv("SpotifyAPIKEY")
     SpotifySecretKey:str = os.getenv("SpotifySecretKey")
 
+    # 외부 API 공유 HTTP 클라이언트 설정
+    http_pool_size: int = os.getenv("HTTP_POOL_SIZE", 100)
+    http_pool_size_per_host: int = os.getenv("HTTP_POOL_SIZE_PER_HOST", 20)
+    http_keepalive_timeout: float = os.getenv("HTTP_KEEPALIVE_TIMEOUT", 30)
+    http_request_timeout: float = os.getenv("HTTP_REQUEST_TIMEOUT", 10)
+
+    # Spotify API 호출 설정
+    spotify_api_url: str = os.getenv("SPOTIFY_API_URL", "https://api.spotify.com/v1")
+    spotify_accounts_url: str = os.getenv("SPOTIFY_ACCOUNTS_URL", "https://accounts.spotify.com")
+    spotify_request_timeout: float = os.getenv("SPOTIFY_REQUEST_TIMEOUT", 10)
+    spotify_enrich_concurrency: int = os.getenv("SPOTIFY_ENRICH_CONCURRENCY", 10)
+    spotify_token_refresh_margin: int = os.getenv("SPOTIFY_TOKEN_REFRESH_MARGIN", 300)
+
+    # Spotify 요청 스케줄러 설정 (초당 요청 수, 버스트 크기, 재시도)
+    spotify_rate_limit: float = os.getenv("SPOTIFY_RATE_LIMIT", 20)
+    spotify_rate_burst: int = os.getenv("SPOTIFY_RATE_BURST", 20)
+    spotify_max_retries: int = os.getenv("SPOTIFY_MAX_RETRIES", 3)
+    spotify_backoff_base: float = os.getenv("SPOTIFY_BACKOFF_BASE", 0.5)
+
+    # Last.fm API 호출 설정
+    lastfm_api_url: str = os.getenv("LASTFM_API_URL", "http://ws.audioscrobbler.com/2.0/")
+
+    # Spotify 트랙 검색 결과 캐시 설정 (TTL은 초 단위)
+    spotify_track_cache_ttl: int = os.getenv("SPOTIFY_TRACK_CACHE_TTL", 7 * 24 * 3600)
+    spotify_track_cache_size: int = os.getenv("SPOTIFY_TRACK_CACHE_SIZE", 10000)
+    spotify_not_found_ttl: int = os.getenv("SPOTIFY_NOT_FOUND_TTL", 6 * 3600)
+    spotify_error_ttl: int = os.getenv("SPOTIFY_ERROR_TTL", 60)
+
+    # 차트 스냅샷 설정 (초 단위)
+    chart_snapshot_soft_ttl: int = os.getenv("CHART_SNAPSHOT_SOFT_TTL", 3600)
+    chart_snapshot_refresh_interval: int = os.getenv("CHART_SNAPSHOT_REFRESH_INTERVAL", 1800)
+
+    # 종류별로 DB에 남겨 둘 스냅샷 버전 수
+    snapshot_keep_versions: int = os.getenv("SNAPSHOT_KEEP_VERSIONS", 5)
+
+    # 인기 아티스트 스냅샷 설정 (초 단위)
+    popular_artists_snapshot_soft_ttl: int = os.getenv("POPULAR_ARTISTS_SNAPSHOT_SOFT_TTL", 12 * 3600)
+    popular_artists_snapshot_refresh_interval: int = os.getenv("POPULAR_ARTISTS_SNAPSHOT_REFRESH_INTERVAL", 6 * 3600)
+
+    # 검색 결과 캐시 설정 (TTL은 초 단위)
+    search_cache_ttl: int = os.getenv("SEARCH_CACHE_TTL", 300)
+    search_cache_size: int = os.getenv("SEARCH_CACHE_SIZE", 1000)
+
+    # 앨범 가져오기 기록 설정 (TTL이 지나면 Spotify에서 다시 가져옴)
+    album_import_ttl: int = os.getenv("ALBUM_IMPORT_TTL", 7 * 24 * 3600)
+    album_cache_size: int = os.getenv("ALBUM_CACHE_SIZE", 1000)
+
+    # 아티스트 메타데이터 설정 (fetched_at이 TTL보다 오래되면 Spotify에서 다시 가져옴)
+    artist_metadata_ttl: int = os.getenv("ARTIST_METADATA_TTL", 24 * 3600)
+    artist_refresh_interval: int = os.getenv("ARTIST_REFRESH_INTERVAL", 600)
+    artist_refresh_batch_size: int = os.getenv("ARTIST_REFRESH_BATCH_SIZE", 200)
+
+    # 사용자별 관심 아티스트 캐시 설정
+    favorite_cache_ttl: int = os.getenv("FAVORITE_CACHE_TTL", 300)
+    favorite_cache_size: int = os.getenv("FAVORITE_CACHE_SIZE", 10000)
+
+    # 인증 사용자 캐시 설정 (get_current_user)
+    principal_cache_ttl: int = os.getenv("PRINCIPAL_CACHE_TTL", 60)
+    principal_cache_size: int = os.getenv("PRINCIPAL_CACHE_SIZE", 10000)
+
+    # 한 요청에서 같은 형태의 SQL이 이 횟수를 넘게 반복되면 N+1 의심 경고
+    query_repeat_warning_threshold: int = os.getenv("QUERY_REPEAT_WARNING_THRESHOLD", 5)
+
 @lru_cache
 def get_config():
     return DefaultConfig()
\ No newline at end of file
@@ -1,62 +1,258 @@
+import asyncio
+import time
+from contextvars import ContextVar
 from typing import Optional
 import ssl  # SSL 모듈 추가
-from sqlalchemy.engine import Engine
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine, URL
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from core.cache import TTLCache
+from core.metrics import register_stats, histogram, add_request_timing
+from core.query_counter import record_query
 
 Base = declarative_base()
 DBSessionLocal: Optional[sessionmaker] = None
+ReadSessionLocal: Optional[sessionmaker] = None
 db_engine: Optional[Engine] = None
+replica_engine: Optional[AsyncEngine] = None
 db_session: Optional[Session] = None
 
-def init_db(config) -> None:
-    global DBSessionLocal, db_engine, db_session
-    postgres_endpoint = config.postgresql_endpoint
-    postgres_port = config.postgresql_port
-    postgres_table = config.postgresql_table
-    postgres_user = config.postgresql_user
-    postgres_password = config.postgresql_password
-    
+# 현재 요청의 인증된 사용자 ID (get_current_user에서 설정)
+current_user_id: ContextVar[Optional[int]] = ContextVar("current_user_id", default=None)
+
+# 엔진별 쿼리 실행 시간
+db_query_seconds = histogram(
+    "db_query_duration_seconds", "SQL statement execution time", ("engine",),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+
+# 최근에 쓰기를 한 사용자 - 이 기간 동안은 읽기 세션도 primary를 사용 (replica 지연 대비)
+_recent_writers: Optional[TTLCache] = None
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """커넥션 대기 시간, 오버플로 발생, 타임아웃을 기록하는 커넥션 풀"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = {
+            'checkouts': 0,
+            'wait_seconds_total': 0.0,
+            'wait_seconds_max': 0.0,
+            'overflow_events': 0,  # pool_size를 넘어 새 커넥션을 연 횟수
+            'timeouts': 0,
+        }
+
+    def _do_get(self):
+        overflow_before = self.overflow()
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_stats['timeouts'] += 1
+            raise
+
+        waited = time.perf_counter() - started
+        self.wait_stats['checkouts'] += 1
+        self.wait_stats['wait_seconds_total'] += waited
+        self.wait_stats['wait_seconds_max'] = max(self.wait_stats['wait_seconds_max'], waited)
+        if self.overflow() > overflow_before and self.overflow() > 0:
+            self.wait_stats['overflow_events'] += 1
+        return connection
+
+    def stats(self) -> dict:
+        return {
+            **self.wait_stats,
+            'wait_seconds_total': round(self.wait_stats['wait_seconds_total'], 4),
+            'wait_seconds_max': round(self.wait_stats['wait_seconds_max'], 4),
+            'pool_size': self.size(),
+            'in_use': self.checkedout(),
+            'idle': self.checkedin(),
+            'overflow': max(0, self.overflow()),
+        }
+
+
+class PrimarySession(Session):
+    """primary DB 세션 - 쓰기가 커밋되면 해당 사용자를 잠시 primary 읽기 대상으로 표시"""
+
+
+class ReadSession(Session):
+    """읽기 전용 세션 - 기본은 replica, 방금 쓰기를 한 사용자는 primary로 라우팅"""
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if replica_engine is None or should_read_from_primary():
+            return db_engine.sync_engine
+        return replica_engine.sync_engine
+
+
+@event.listens_for(PrimarySession, "after_flush")
+def _mark_flush_write(session, flush_context):
+    session.info["has_writes"] = True
+
+@event.listens_for(PrimarySession, "do_orm_execute")
+def _mark_statement_write(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["has_writes"] = True
+
+@event.listens_for(PrimarySession, "after_commit")
+def _record_writer(session):
+    if session.info.pop("has_writes", False):
+        mark_user_wrote(current_user_id.get())
+
+@event.listens_for(PrimarySession, "after_rollback")
+def _clear_writes(session):
+    session.info.pop("has_writes", None)
+
+def mark_user_wrote(user_id: Optional[int]) -> None:
+    """사용자가 쓰기를 했음을 기록 (sticky primary 기간 시작)"""
+    if user_id is not None and _recent_writers is not None:
+        _recent_writers.set(user_id, True)
+
+def should_read_from_primary() -> bool:
+    user_id = current_user_id.get()
+    return user_id is not None and _recent_writers is not None and user_id in _recent_writers
+
+def _create_ssl_context(config):
+    """DB_SSL_MODE에 따른 SSL 설정 (disable / require / verify)"""
+    mode = (config.db_ssl_mode or "require").lower()
+    if mode == "disable":
+        return False
+
+    ssl_context = ssl.create_default_context(cafile=config.db_ssl_ca_file or None)
+    if mode != "verify":
+        # require: 암호화만 사용하고 인증서 검증은 하지 않음
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+    return ssl_context
+
+def _create_engine(endpoint, port, config) -> AsyncEngine:
     # URL 생성 (asyncpg 드라이버 사용)
-    db_url = (
-        "postgresql+asyncpg://"
-        + f"{postgres_user}:{postgres_password}"
-        + f"@{postgres_endpoint}:{postgres_port}/{postgres_table}"
+    db_url = URL.create(
+        "postgresql+asyncpg",
+        username=config.postgresql_user,
+        password=config.postgresql_password,
+        host=endpoint,
+        port=port,
+        database=config.postgresql_table,
+        # SQLAlchemy 쪽 prepared statement 캐시 크기
+        query={"prepared_statement_cache_size": str(config.db_statement_cache_size)},
+    )
+
+    return create_async_engine(
+        db_url,
+        poolclass=TimedQueuePool,
+        pool_size=config.db_pool_size,
+        max_overflow=config.db_max_overflow,
+        pool_timeout=config.db_pool_timeout,
+        pool_recycle=config.db_pool_recycle,
+        pool_pre_ping=config.db_pool_pre_ping,
+        connect_args={
+            "ssl": _create_ssl_context(config),
+            # asyncpg 커넥션별 statement 캐시 크기 (pgbouncer 등에서는 0)
+            "statement_cache_size": config.db_statement_cache_size,
+        }
     )
-    
+
+def _instrument_engine(engine: AsyncEngine, name: str) -> None:
+    """쿼리 실행 시간을 엔진별 지표와 현재 요청의 DB 시간에 기록 (SQL 형태별 횟수도 집계)"""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        db_query_seconds.observe(elapsed, name)
+        add_request_timing('db', elapsed)
+        record_query(statement)
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def _handle_error(exception_context):
+        # 실패한 쿼리는 after_cursor_execute가 호출되지 않으므로 시작 시간만 정리
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_started"):
+            connection.info["query_started"].pop()
+
+def get_pool_stats() -> dict:
+    """primary/replica 커넥션 풀 통계"""
+    stats = {}
+    for name, engine in (("primary", db_engine), ("replica", replica_engine)):
+        if engine is not None and isinstance(engine.pool, TimedQueuePool):
+            stats[name] = engine.pool.stats()
+    return stats
+
+register_stats('db_pool', get_pool_stats)
+
+def init_db(config) -> None:
+    global DBSessionLocal, ReadSessionLocal, db_engine, replica_engine, _recent_writers
+
     try:
-        # SSL 인증서 검증 비활성화 설정
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-        
-        # 비동기 엔진 생성에 SSL 설정 추가
-        db_engine = create_async_engine(
-            db_url,
-            connect_args={"ssl": ssl_context}  # SSL 컨텍스트 추가
-        )
-        
+        db_engine = _create_engine(config.postgresql_endpoint, config.postgresql_port, config)
+        _instrument_engine(db_engine, "primary")
+
+        # 읽기 전용 replica (설정하지 않으면 읽기 세션도 primary 사용)
+        if config.postgresql_replica_endpoint:
+            replica_engine = _create_engine(
+                config.postgresql_replica_endpoint,
+                config.postgresql_replica_port or config.postgresql_port,
+                config
+            )
+            _instrument_engine(replica_engine, "replica")
+
+        _recent_writers = TTLCache(maxsize=10000, ttl=config.db_sticky_primary_seconds)
+
         # 비동기 세션메이커 설정
         DBSessionLocal = sessionmaker(
             bind=db_engine,
             autoflush=False,
             expire_on_commit=False,
             class_=AsyncSession,
+            sync_session_class=PrimarySession,
+        )
+        ReadSessionLocal = sessionmaker(
+            autoflush=False,
+            expire_on_commit=False,
+            class_=AsyncSession,
+            sync_session_class=ReadSession,
         )
         print("Database connection successful.")
     except Exception as e:
         print(f"Database connection failed. Reason: {str(e)}")
-        print(f"Failed URL: {db_url}")
+        print(f"Failed endpoint: {config.postgresql_endpoint}:{config.postgresql_port}/{config.postgresql_table}")
+
+async def warmup_db(connections: int) -> None:
+    """커넥션 풀 미리 채우기 (배포 직후 첫 요청이 연결 비용을 내지 않도록)"""
+    if db_engine is None:
+        raise ImportError("You need to call init_db before this function")
+
+    async def ping(engine: AsyncEngine) -> None:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    for engine in (db_engine, replica_engine):
+        if engine is not None:
+            # 동시에 연결해야 풀에 connections개가 채워짐
+            await asyncio.gather(*(ping(engine) for _ in range(connections)))
+
+async def close_db() -> None:
+    """엔진 커넥션 정리 (앱 종료 시)"""
+    for engine in (replica_engine, db_engine):
+        if engine is not None:
+            await engine.dispose()
 
 # provide_session 함수는 변경 없음
 async def provide_session():
     if DBSessionLocal is None:
         raise ImportError("You need to call init_db before this function")
-    
+
     # 비동기 세션 생성
     async_session = DBSessionLocal()
-    
+
     try:
         yield async_session
     except Exception as e:
@@ -65,4 +261,17 @@ async def provide_session():
     else:
         await async_session.commit()
     finally:
-        await async_session.close()
\ No newline at end of file
+        await async_session.close()
+
+# 조회 전용 API용 세션 (커밋하지 않음, replica 라우팅)
+async def provide_read_session():
+    if ReadSessionLocal is None:
+        raise ImportError("You need to call init_db before this function")
+
+    async_session = ReadSessionLocal()
+
+    try:
+        yield async_session
+    finally:
+        # 커밋 없이 트랜잭션 종료
+        await async_session.close()
@@ -1,7 +1,12 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+from fastapi import HTTPException, status
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
 from passlib.context import CryptContext
 from core.config import get_config
+from core.metrics import register_stats
 
 config = get_config()
 
@@ -26,13 +31,65 @@ def verify_jwt(token: str):
     except JWTError:
         return None
     
-# CryptContext 설정
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# CryptContext 설정 - 저장된 해시의 cost가 설정값과 다르면 needs_update로 판단
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=config.bcrypt_rounds,
+    bcrypt__min_rounds=config.bcrypt_rounds,
+    bcrypt__max_rounds=config.bcrypt_rounds,
+)
+
+# bcrypt는 CPU를 오래 쓰므로 이벤트 루프 밖의 전용 스레드 풀에서 실행
+_password_pool = ThreadPoolExecutor(max_workers=config.password_pool_size, thread_name_prefix="password")
+_password_pending = 0  # 실행 중 + 대기 중인 작업 수
+
+_password_stats = {'completed': 0, 'failed': 0, 'rejected': 0}
+
+def get_password_pool_stats() -> dict:
+    return {
+        **_password_stats,
+        'pending': _password_pending,
+        'pool_size': config.password_pool_size,
+        'max_pending': config.password_max_pending,
+    }
+
+register_stats('password_pool', get_password_pool_stats)
+
+async def _run_password_task(func: Callable, *args):
+    """대기 작업이 admission 한도를 넘으면 바로 503 반환 (로그인 폭주 시 다른 요청 보호)"""
+    global _password_pending
+    if _password_pending >= config.password_max_pending:
+        _password_stats['rejected'] += 1
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many password requests, please retry shortly",
+            headers={"Retry-After": "1"},
+        )
+
+    _password_pending += 1
+    try:
+        result = await asyncio.get_running_loop().run_in_executor(_password_pool, func, *args)
+    except BaseException:
+        _password_stats['failed'] += 1
+        raise
+    finally:
+        _password_pending -= 1
+
+    _password_stats['completed'] += 1
+    return result
+
+def shutdown_password_pool() -> None:
+    _password_pool.shutdown(wait=False, cancel_futures=True)
 
 # 패스워드 해싱
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+async def hash_password(password: str) -> str:
+    return await _run_password_task(pwd_context.hash, password)
 
 # 패스워드 검증
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await _run_password_task(pwd_context.verify, plain_password, hashed_password)
+
+# 패스워드 검증 + cost가 바뀐 해시면 새 해시 반환 (로그인 시 재해싱용)
+async def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    return await _run_password_task(pwd_context.verify_and_update, plain_password, hashed_password)
@@ -0,0 +1,49 @@
+import hashlib
+from typing import Any, Optional
+from fastapi import Request, Response
+
+# Cache-Control 기본값 (no-cache: 저장은 하되 매번 ETag로 재검증)
+PUBLIC_REVALIDATE = "public, no-cache"
+PRIVATE_REVALIDATE = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """버전, 최신 ID 등 응답을 결정하는 값들로 strong ETag 생성"""
+    digest = hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()
+    return f'"{digest[:32]}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 현재 ETag와 일치하는지 확인"""
+    header = request.headers.get('if-none-match')
+    if not header:
+        return False
+    if header.strip() == '*':
+        return True
+
+    # If-None-Match는 weak 비교 (W/ 접두사 무시)
+    candidates = {value.strip().removeprefix('W/') for value in header.split(',')}
+    return etag in candidates
+
+def set_cache_headers(response: Response, etag: str, cache_control: str = PUBLIC_REVALIDATE) -> None:
+    response.headers['ETag'] = etag
+    response.headers['Cache-Control'] = cache_control
+
+def not_modified(etag: str, cache_control: str = PUBLIC_REVALIDATE) -> Response:
+    """본문 없는 304 응답"""
+    return Response(status_code=304, headers={'ETag': etag, 'Cache-Control': cache_control})
+
+def check_not_modified(
+    request: Request,
+    response: Response,
+    etag: str,
+    cache_control: str = PUBLIC_REVALIDATE
+) -> Optional[Response]:
+    """
+    ETag가 일치하면 304 응답을 반환하고, 아니면 응답에 캐시 헤더를 설정 후 None 반환
+    - 무거운 조회/직렬화 전에 호출
+    """
+    if etag_matches(request, etag):
+        return not_modified(etag, cache_control)
+
+    set_cache_headers(response, etag, cache_control)
+    return None
@@ -0,0 +1,91 @@
+import time
+import aiohttp
+from typing import Any, Dict, NamedTuple, Optional
+from urllib.parse import urlsplit
+from core.config import get_config
+from core.metrics import histogram, add_request_timing
+
+config = get_config()
+
+# 외부 API별 커넥션 풀 (업스트림마다 별도 keep-alive 풀 사용)
+UPSTREAMS = ('spotify_api', 'spotify_accounts', 'lastfm')
+
+_sessions: Dict[str, aiohttp.ClientSession] = {}
+
+# 외부 API 호스트별 응답 시간 (status는 HTTP 상태 코드 또는 error)
+upstream_request_seconds = histogram(
+    "upstream_request_duration_seconds", "Outbound HTTP request time per upstream host", ("host", "status")
+)
+
+
+class HttpResponse(NamedTuple):
+    status: int
+    data: Any  # JSON 응답 (JSON이 아니면 None)
+    text: str
+    headers: Dict[str, str]
+
+
+def _create_session() -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(
+        limit=config.http_pool_size,
+        limit_per_host=config.http_pool_size_per_host,
+        keepalive_timeout=config.http_keepalive_timeout,
+        ttl_dns_cache=300,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=config.http_request_timeout),
+    )
+
+async def start_http_clients() -> None:
+    """업스트림별 공유 HTTP 세션 생성 (앱 시작 시)"""
+    for upstream in UPSTREAMS:
+        if upstream not in _sessions or _sessions[upstream].closed:
+            _sessions[upstream] = _create_session()
+
+async def close_http_clients() -> None:
+    """공유 HTTP 세션 종료 (앱 종료 시)"""
+    for session in _sessions.values():
+        await session.close()
+    _sessions.clear()
+
+def get_http_session(upstream: str) -> aiohttp.ClientSession:
+    """업스트림의 공유 세션 반환 (lifespan 밖에서 호출되면 지연 생성)"""
+    if upstream not in UPSTREAMS:
+        raise ValueError(f"Unknown upstream: {upstream}")
+
+    session = _sessions.get(upstream)
+    if session is None or session.closed:
+        session = _sessions[upstream] = _create_session()
+    return session
+
+async def request(
+    upstream: str,
+    method: str,
+    url: str,
+    *,
+    timeout: Optional[float] = None,
+    **kwargs
+) -> HttpResponse:
+    """공유 세션으로 HTTP 요청 후 응답 본문까지 읽어서 반환"""
+    session = get_http_session(upstream)
+    if timeout is not None:
+        kwargs['timeout'] = aiohttp.ClientTimeout(total=timeout)
+
+    host = urlsplit(url).hostname or upstream
+    status = "error"
+    started = time.perf_counter()
+    try:
+        async with session.request(method, url, **kwargs) as response:
+            status = str(response.status)
+            text = await response.text()
+            try:
+                data = await response.json(content_type=None)
+            except ValueError:
+                data = None
+
+            return HttpResponse(response.status, data, text, dict(response.headers))
+    finally:
+        elapsed = time.perf_counter() - started
+        upstream_request_seconds.observe(elapsed, host, status)
+        add_request_timing('upstream', elapsed)
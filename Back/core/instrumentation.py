@@ -0,0 +1,101 @@
+import time
+from core.config import get_config
+from core.metrics import (
+    histogram, gauge, counter, begin_request_timings, end_request_timings, get_request_timings
+)
+from core.query_counter import QueryCounter
+
+config = get_config()
+
+# 요청 처리 지표 (route는 경로 템플릿 - /api/album/{album_id} 등)
+request_seconds = histogram(
+    "http_request_duration_seconds", "HTTP request latency per route", ("method", "route", "status")
+)
+requests_in_flight = gauge(
+    "http_requests_in_flight", "HTTP requests currently being processed", ("method",)
+)
+request_db_queries = histogram(
+    "http_request_db_queries", "SQL statements executed per request", ("route",),
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100)
+)
+request_db_seconds = histogram(
+    "http_request_db_seconds", "Time spent in SQL statements per request", ("route",)
+)
+request_upstream_seconds = histogram(
+    "http_request_upstream_seconds", "Time spent in outbound HTTP calls per request", ("route",)
+)
+
+repeated_query_warnings = counter(
+    "repeated_query_warnings_total", "Requests where one SQL shape repeated past the threshold (N+1 suspects)", ("route",)
+)
+
+
+def _route_template(scope) -> str:
+    # FastAPI가 라우팅 후 scope에 매칭된 route를 넣어 둠 (매칭 실패 시 고정 라벨로 카디널리티 제한)
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+def _server_timing(timings: dict, total: float) -> bytes:
+    return (
+        f"db;dur={timings['db_seconds'] * 1000:.1f};desc=\"{timings['db_queries']} queries\", "
+        f"upstream;dur={timings['upstream_seconds'] * 1000:.1f}, "
+        f"total;dur={total * 1000:.1f}"
+    ).encode("latin-1")
+
+
+class MetricsMiddleware:
+    """
+    요청별 지연 시간, 처리 중인 요청 수, DB/외부 API 소요 시간을 기록하는 ASGI 미들웨어
+    - SQL을 형태별로 집계해 같은 형태가 반복되면 N+1 의심 경고 출력
+    - 응답에 Server-Timing 헤더(db/upstream/total)를 추가해 느린 요청의 원인을 바로 확인
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        started = time.perf_counter()
+        token = begin_request_timings()
+        requests_in_flight.inc(method)
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", _server_timing(get_request_timings(), time.perf_counter() - started)))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            with QueryCounter() as queries:
+                await self.app(scope, receive, send_with_timing)
+        finally:
+            elapsed = time.perf_counter() - started
+            route = _route_template(scope)
+            timings = get_request_timings()
+
+            requests_in_flight.dec(method)
+            request_seconds.observe(elapsed, method, route, str(status))
+            request_db_queries.observe(timings['db_queries'], route)
+            request_db_seconds.observe(timings['db_seconds'], route)
+            request_upstream_seconds.observe(timings['upstream_seconds'], route)
+            end_request_timings(token)
+
+        _warn_repeated_queries(method, route, queries)
+
+def _warn_repeated_queries(method: str, route: str, queries: QueryCounter) -> None:
+    """같은 형태의 SQL이 반복된 요청 경고 (루프 안에서 쿼리하는 N+1 패턴)"""
+    repeated = queries.repeated(config.query_repeat_warning_threshold)
+    if not repeated:
+        return
+
+    repeated_query_warnings.inc(route)
+    for shape, count in repeated:
+        print(f"Repeated query warning: {method} {route} ran {count}x (of {queries.count} queries): {shape[:300]}")
@@ -0,0 +1,172 @@
+import math
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# 이름별 통계 제공 함수 (각 모듈이 import 시점에 등록)
+_stats_providers: Dict[str, Callable[[], dict]] = {}
+
+def register_stats(name: str, provider: Callable[[], dict]) -> None:
+    """통계 제공 함수 등록"""
+    _stats_providers[name] = provider
+
+def collect_stats() -> Dict[str, dict]:
+    """등록된 모든 통계 수집"""
+    stats = {}
+    for name, provider in _stats_providers.items():
+        try:
+            stats[name] = provider()
+        except Exception as e:
+            stats[name] = {"error": str(e)}
+    return stats
+
+
+# Prometheus 텍스트 형식 지표 (/metrics)
+METRIC_PREFIX = "musiq"
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(labelnames: Sequence[str], labels: Sequence, extra: Tuple[str, str] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, labels)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = f"{METRIC_PREFIX}_{name}"
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._series: Dict[tuple, object] = {}
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for labels, value in sorted(self._series.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labels, amount: float = 1) -> None:
+        self._series[labels] = self._series.get(labels, 0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def inc(self, *labels, amount: float = 1) -> None:
+        self._series[labels] = self._series.get(labels, 0) + amount
+
+    def dec(self, *labels, amount: float = 1) -> None:
+        self._series[labels] = self._series.get(labels, 0) - amount
+
+    def set(self, value: float, *labels) -> None:
+        self._series[labels] = value
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 - 값은 [버킷별 개수..., 합계, 개수]"""
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, *labels) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * len(self.buckets) + [0.0, 0]
+
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[index] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for labels, series in sorted(self._series.items()):
+            for bound, count in zip(self.buckets, series):
+                bucket_labels = _format_labels(self.labelnames, labels, ("le", _format_value(bound)))
+                lines.append(f"{self.name}_bucket{bucket_labels} {count}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(round(series[-2], 6))}")
+            lines.append(f"{self.name}_count{label_text} {series[-1]}")
+        return lines
+
+
+_metrics: Dict[str, _Metric] = {}
+
+def _register(metric: _Metric) -> _Metric:
+    # 모듈이 다시 import되어도 같은 지표를 공유
+    return _metrics.setdefault(metric.name, metric)
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+    return _register(Counter(name, documentation, labelnames))
+
+def gauge(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+    return _register(Gauge(name, documentation, labelnames))
+
+def histogram(name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+    return _register(Histogram(name, documentation, labelnames, buckets))
+
+def _flatten_stats(prefix: str, value, out: List[Tuple[str, float]]) -> None:
+    if isinstance(value, dict):
+        for key, item in value.items():
+            _flatten_stats(f"{prefix}_{key}" if prefix else str(key), item, out)
+    elif isinstance(value, (bool, int, float)):
+        out.append((prefix, float(value)))
+
+def render_metrics() -> str:
+    """등록된 지표 + 통계 제공 함수의 숫자 값(캐시 적중률 등)을 Prometheus 텍스트로 출력"""
+    lines = []
+    for metric in _metrics.values():
+        lines.extend(metric.render())
+
+    stats_name = f"{METRIC_PREFIX}_stats"
+    lines.append(f"# HELP {stats_name} Values reported by registered stats providers (/api/stats)")
+    lines.append(f"# TYPE {stats_name} gauge")
+    for provider, stats in collect_stats().items():
+        values = []
+        _flatten_stats("", stats, values)
+        for key, value in values:
+            lines.append(f'{stats_name}{{provider="{_escape(provider)}",key="{_escape(key)}"}} {_format_value(value)}')
+
+    return "\n".join(lines) + "\n"
+
+
+# 요청 단위 DB/외부 API 소요 시간 (MetricsMiddleware가 요청마다 설정)
+_request_timings: ContextVar[Optional[dict]] = ContextVar("request_timings", default=None)
+
+def begin_request_timings():
+    return _request_timings.set({
+        'db_queries': 0,
+        'db_seconds': 0.0,
+        'upstream_calls': 0,
+        'upstream_seconds': 0.0,
+    })
+
+def end_request_timings(token) -> None:
+    _request_timings.reset(token)
+
+def get_request_timings() -> Optional[dict]:
+    return _request_timings.get()
+
+def add_request_timing(kind: str, seconds: float) -> None:
+    """현재 요청에 DB 쿼리(kind='db') 또는 외부 API 호출(kind='upstream') 시간 누적"""
+    timings = _request_timings.get()
+    if timings is None:
+        return
+    timings['db_queries' if kind == 'db' else 'upstream_calls'] += 1
+    timings[f'{kind}_seconds'] += seconds
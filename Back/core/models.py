@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Boolean, Table
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Boolean, Table, JSON, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from core.database import Base
@@ -40,6 +40,11 @@ class Artist(Base):
     image_url = Column(String(255), nullable=True)
     spotify_id = Column(String(50), nullable=True, unique=True)
     lastfm_id = Column(String(50), nullable=True, unique=True)
+    # Spotify 메타데이터 (fetched_at: 마지막으로 Spotify에서 가져온 시각)
+    genres = Column(JSON, nullable=True)
+    popularity = Column(Integer, nullable=True)
+    followers = Column(Integer, nullable=True)
+    fetched_at = Column(DateTime(timezone=True), nullable=True, index=True)
     
     # 관계 정의
     songs = relationship("Song", back_populates="artist")
@@ -49,6 +54,9 @@ class Artist(Base):
 
 class Album(Base):
     __tablename__ = "albums"
+    __table_args__ = (
+        UniqueConstraint('title', 'artist_id', name='uq_albums_title_artist'),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(100), nullable=False)
@@ -63,6 +71,9 @@ class Album(Base):
 
 class Song(Base):
     __tablename__ = "songs"
+    __table_args__ = (
+        UniqueConstraint('title', 'artist_id', name='uq_songs_title_artist'),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(100), nullable=False)
@@ -88,6 +99,7 @@ class Playlist(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    version = Column(Integer, nullable=False, default=1, server_default='1')  # 내용이 바뀔 때마다 증가 (ETag용)
     
     # 관계 정의
     user = relationship("User", back_populates="playlists")
@@ -147,4 +159,42 @@ class RecommendedSong(Base):
 
     user = relationship("User", backref="recommended_songs")
     artist = relationship("Artist", backref="recommended_songs_to_users")
-    song = relationship("Song", backref="recommended_to_users")
\ No newline at end of file
+    song = relationship("Song", backref="recommended_to_users")
+
+# 차트 등 미리 계산된 응답 스냅샷
+class Snapshot(Base):
+    __tablename__ = "snapshots"
+    __table_args__ = (
+        UniqueConstraint('kind', 'version', name='uq_snapshots_kind_version'),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String(50), nullable=False, index=True)
+    version = Column(Integer, nullable=False)
+    payload = Column(JSON, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+# Spotify 트랙 검색 결과 캐시 (정규화된 트랙명 + 아티스트명 기준)
+class SpotifyTrackCache(Base):
+    __tablename__ = "spotify_track_cache"
+
+    cache_key = Column(Text, primary_key=True)
+    status = Column(String(20), nullable=False, default='found', server_default='found')  # found / not_found
+    spotify_id = Column(String(50), nullable=True)
+    duration_ms = Column(Integer, nullable=True)
+    preview_url = Column(String(255), nullable=True)
+    album_name = Column(Text, nullable=True)
+    album_spotify_id = Column(String(50), nullable=True)
+    album_image = Column(String(255), nullable=True)
+    artist_spotify_id = Column(String(50), nullable=True)
+    fetched_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+
+# Spotify 앨범 가져오기 기록 (앨범 정보 + song_id가 포함된 트랙 목록)
+class AlbumImport(Base):
+    __tablename__ = "album_imports"
+
+    spotify_album_id = Column(String(50), primary_key=True)
+    album = Column(JSON, nullable=False)
+    tracks = Column(JSON, nullable=False)
+    imported_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow, server_default=func.now())
@@ -0,0 +1,118 @@
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+# SQL 형태 정규화 (파라미터/리터럴 제거, IN 목록 길이 무시)
+# asyncpg 캐스트(::VARCHAR, ::INTEGER[], ::TIMESTAMP WITH TIME ZONE 등)까지만 지우고 뒤의 SQL은 남김
+_PLACEHOLDER = re.compile(
+    r"\$\d+(::(TIMESTAMP WITH(OUT)? TIME ZONE|TIME WITH(OUT)? TIME ZONE|DOUBLE PRECISION|CHARACTER VARYING|\w+)(\[\])?)?"
+    r"|%\(\w+\)s|\?"
+)
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(\.\d+)?\b")
+_VALUE_LIST = re.compile(r"\(\s*\?(\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+def normalize_statement(statement: str) -> str:
+    """같은 쿼리를 값만 바꿔 반복하면 같은 문자열이 되도록 SQL 정규화"""
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _PLACEHOLDER.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _VALUE_LIST.sub("(?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryCounter:
+    """with 블록 안에서 실행된 SQL 수를 형태별로 집계 (중첩 가능)"""
+
+    def __init__(self):
+        self.count = 0
+        self.shapes: Counter = Counter()
+        self._token = None
+
+    def __enter__(self) -> "QueryCounter":
+        self._token = _active_counters.set(_active_counters.get() + (self,))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _active_counters.reset(self._token)
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """threshold번을 넘게 반복된 SQL 형태 (많은 순)"""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count > threshold]
+
+    def summary(self, limit: int = 10) -> str:
+        lines = [f"{self.count} queries"]
+        lines.extend(f"  {count}x {shape[:200]}" for shape, count in self.shapes.most_common(limit))
+        return "\n".join(lines)
+
+
+_active_counters: ContextVar[Tuple[QueryCounter, ...]] = ContextVar("active_query_counters", default=())
+
+def record_query(statement: str) -> None:
+    """엔진 이벤트에서 호출 - 활성화된 모든 카운터에 기록"""
+    counters = _active_counters.get()
+    if not counters:
+        return
+
+    shape = normalize_statement(statement)
+    for counter in counters:
+        counter.count += 1
+        counter.shapes[shape] += 1
+
+
+@contextmanager
+def assert_max_queries(max_queries: int):
+    """
+    블록 안에서 실행된 SQL이 max_queries개를 넘으면 형태별 내역과 함께 AssertionError 발생
+    - 예: with assert_max_queries(3): await get_user_favorite_artists(db=db, current_user=user)
+    """
+    with QueryCounter() as counter:
+        yield counter
+
+    if counter.count > max_queries:
+        raise AssertionError(f"Expected at most {max_queries} queries, got {counter.summary()}")
+
+
+async def assert_endpoint_max_queries(
+    app,
+    method: str,
+    path: str,
+    max_queries: int,
+    query_string: str = "",
+    headers: Optional[Dict[str, str]] = None
+) -> int:
+    """
+    ASGI 앱에 요청을 직접 보내 엔드포인트의 쿼리 수 확인 (HTTP 클라이언트 의존성 없음)
+    - 시드 데이터가 있는 로컬 Postgres에 init_db 후 실행, 응답 상태 코드 반환
+    - 예: await assert_endpoint_max_queries(app, "GET", "/artists/favorites", 3, headers={"Authorization": f"Bearer {token}"})
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method.upper(),
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query_string.encode(),
+        "root_path": "",
+        "headers": [(key.lower().encode(), value.encode()) for key, value in (headers or {}).items()],
+        "client": ("127.0.0.1", 0),
+        "server": ("testserver", 80),
+    }
+    status = None
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    with assert_max_queries(max_queries):
+        await app(scope, receive, send)
+    return status
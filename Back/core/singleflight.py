@@ -0,0 +1,39 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 비동기 작업을 하나로 합치는 그룹
+    - 진행 중인 작업이 있으면 새로 실행하지 않고 그 결과(또는 예외)를 함께 기다림
+    - 작업이 끝나면 키를 비워서 다음 요청은 새로 실행
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self._stats = {
+            'calls': 0,   # 실제로 실행한 작업 수
+            'shared': 0,  # 진행 중인 작업에 합류한 요청 수
+        }
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._tasks.get(key)
+        if task is None:
+            self._stats['calls'] += 1
+            task = self._tasks[key] = asyncio.create_task(fn())
+            task.add_done_callback(lambda done, key=key: self._forget(key, done))
+        else:
+            self._stats['shared'] += 1
+
+        # 기다리던 요청이 취소되어도 공유 작업은 계속 진행
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            task.exception()  # 기다리는 요청이 없을 때 "exception was never retrieved" 경고 방지
+
+    def stats(self) -> dict:
+        return {**self._stats, 'in_flight': len(self._tasks)}
@@ -0,0 +1,171 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Optional
+from sqlalchemy import delete, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from core import database
+from core.models import Snapshot
+
+
+@dataclass
+class SnapshotEntry:
+    version: int
+    created_at: datetime
+    payload: Any
+
+    @property
+    def age_seconds(self) -> float:
+        created_at = self.created_at
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        return (datetime.now(timezone.utc) - created_at).total_seconds()
+
+
+class SnapshotStore:
+    """
+    미리 계산된 응답 스냅샷 저장소
+    - 최신 스냅샷은 메모리에 보관하고 DB(snapshots 테이블)에 버전과 함께 영구 저장
+    - soft TTL이 지나면 오래된 스냅샷을 그대로 반환하면서 백그라운드에서 한 번만 재생성
+    - 동시 요청이 몰려도 재생성 작업은 항상 하나만 실행
+    - 새 스냅샷 저장 후 최근 keep_versions개만 남기고 이전 버전 삭제
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        builder: Callable[[AsyncSession], Awaitable[Any]],
+        soft_ttl: float,
+        refresh_interval: float,
+        keep_versions: int = 5
+    ):
+        self.kind = kind
+        self._builder = builder
+        self.soft_ttl = soft_ttl
+        self.refresh_interval = refresh_interval
+        self.keep_versions = max(1, keep_versions)
+        self._current: Optional[SnapshotEntry] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._worker_task: Optional[asyncio.Task] = None
+
+    @property
+    def current(self) -> Optional[SnapshotEntry]:
+        return self._current
+
+    def is_stale(self) -> bool:
+        return self._current is None or self._current.age_seconds >= self.soft_ttl
+
+    async def get(self) -> SnapshotEntry:
+        """최신 스냅샷 반환 (없으면 생성될 때까지 대기, 오래됐으면 백그라운드 재생성)"""
+        if self._current is None:
+            await self.refresh()
+        elif self.is_stale():
+            self.trigger_refresh()
+        return self._current
+
+    def trigger_refresh(self) -> asyncio.Task:
+        """진행 중인 재생성 작업이 없을 때만 새로 시작 (single-flight)"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh())
+            self._refresh_task.add_done_callback(self._log_refresh_error)
+        return self._refresh_task
+
+    async def refresh(self) -> SnapshotEntry:
+        # 대기 중인 요청이 취소되어도 공유 작업은 계속 진행
+        return await asyncio.shield(self.trigger_refresh())
+
+    async def start(self) -> None:
+        """DB에 저장된 최신 스냅샷을 불러오고 백그라운드 갱신 루프 시작"""
+        try:
+            await self._load_latest()
+        except Exception as e:
+            print(f"Failed to load {self.kind} snapshot: {str(e)}")
+
+        if self._worker_task is None:
+            self._worker_task = asyncio.create_task(self._run_worker())
+
+    async def stop(self) -> None:
+        for task in (self._worker_task, self._refresh_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._worker_task = None
+        self._refresh_task = None
+
+    async def _run_worker(self) -> None:
+        while True:
+            if self._current is None or self._current.age_seconds >= self.refresh_interval:
+                try:
+                    await self.refresh()
+                except Exception:
+                    pass  # 오류는 _log_refresh_error에서 출력, 기존 스냅샷 유지
+
+            age = self._current.age_seconds if self._current else self.refresh_interval
+            await asyncio.sleep(max(1.0, self.refresh_interval - age))
+
+    async def _load_latest(self) -> None:
+        async with database.DBSessionLocal() as db:
+            result = await db.execute(
+                select(Snapshot)
+                .where(Snapshot.kind == self.kind)
+                .order_by(Snapshot.version.desc())
+                .limit(1)
+            )
+            row = result.scalars().first()
+
+        if row and (self._current is None or row.version > self._current.version):
+            self._current = SnapshotEntry(row.version, row.created_at, row.payload)
+            print(f"{self.kind} 스냅샷 v{row.version} 로드 완료")
+
+    async def _refresh(self) -> SnapshotEntry:
+        started = datetime.now()
+        async with database.DBSessionLocal() as db:
+            payload = await self._builder(db)
+            await db.commit()
+
+            result = await db.execute(
+                select(func.coalesce(func.max(Snapshot.version), 0)).where(Snapshot.kind == self.kind)
+            )
+            version = result.scalar() + 1
+            if isinstance(payload, dict):
+                payload["version"] = version
+
+            # 나이 계산에 쓰이므로 UTC로 명시 (naive datetime은 호스트 시간대로 저장됨)
+            row = Snapshot(kind=self.kind, version=version, payload=payload, created_at=datetime.now(timezone.utc))
+            db.add(row)
+            try:
+                await db.commit()
+            except IntegrityError:
+                # 다른 프로세스가 같은 버전을 먼저 저장한 경우 그 스냅샷을 사용
+                await db.rollback()
+                await self._load_latest()
+                return self._current
+            await db.refresh(row)
+            await self._prune(db, version)
+
+        self._current = SnapshotEntry(version, row.created_at, payload)
+        print(f"{self.kind} 스냅샷 v{version} 생성 완료 ({(datetime.now() - started).total_seconds():.1f}s)")
+        return self._current
+
+    async def _prune(self, db: AsyncSession, version: int) -> None:
+        """최근 keep_versions개보다 오래된 스냅샷 삭제 (실패해도 새 스냅샷은 유지)"""
+        try:
+            await db.execute(
+                delete(Snapshot).where(
+                    Snapshot.kind == self.kind,
+                    Snapshot.version <= version - self.keep_versions
+                )
+            )
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            print(f"Failed to prune {self.kind} snapshots: {str(e)}")
+
+    def _log_refresh_error(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception():
+            print(f"Error refreshing {self.kind} snapshot: {str(task.exception())}")
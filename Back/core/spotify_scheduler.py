@@ -0,0 +1,169 @@
+import asyncio
+import heapq
+import itertools
+import random
+import time
+import aiohttp
+from typing import Optional
+from core.config import get_config
+from core.http_client import HttpResponse, request
+from core.metrics import register_stats
+from core.spotify_token import spotify_tokens
+
+config = get_config()
+
+# 요청 우선순위 (값이 작을수록 먼저 처리)
+INTERACTIVE = 0  # 사용자 검색 등 응답 대기 중인 요청
+BACKGROUND = 1   # 차트/인기 아티스트 갱신 등 백그라운드 작업
+
+PRIORITY_NAMES = {INTERACTIVE: 'interactive', BACKGROUND: 'background'}
+
+
+class SpotifyScheduler:
+    """
+    모든 Spotify Web API 호출 앞단의 요청 스케줄러
+    - 토큰 버킷으로 초당 요청 수 제한, 대기열은 우선순위 순서로 처리
+    - 429 응답이 오면 Retry-After 동안 전체 요청을 일시 정지
+    - 429/5xx/네트워크 오류는 지터를 넣은 지수 백오프로 재시도
+    """
+
+    def __init__(self, rate: float, burst: int, max_retries: int, backoff_base: float):
+        self.rate = rate
+        self.capacity = burst
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters = []  # (priority, seq, future)
+        self._seq = itertools.count()
+        self._dispatcher: Optional[asyncio.Task] = None
+
+        self._stats = {
+            'requests': 0,
+            'throttled': 0,  # 429 응답 수
+            'retries': 0,
+            'wait_count': {name: 0 for name in PRIORITY_NAMES.values()},
+            'wait_seconds_total': {name: 0.0 for name in PRIORITY_NAMES.values()},
+            'wait_seconds_max': {name: 0.0 for name in PRIORITY_NAMES.values()},
+        }
+
+    async def acquire(self, priority: int = INTERACTIVE) -> None:
+        """요청 한 건을 보낼 수 있을 때까지 대기"""
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        self._wake_dispatcher()
+
+        started = time.monotonic()
+        await future  # 취소되면 dispatcher가 done 상태를 보고 건너뜀
+
+        name = PRIORITY_NAMES.get(priority, str(priority))
+        waited = time.monotonic() - started
+        self._stats['wait_count'][name] = self._stats['wait_count'].get(name, 0) + 1
+        self._stats['wait_seconds_total'][name] = self._stats['wait_seconds_total'].get(name, 0.0) + waited
+        self._stats['wait_seconds_max'][name] = max(self._stats['wait_seconds_max'].get(name, 0.0), waited)
+
+    def pause(self, seconds: float) -> None:
+        """429 응답 시 모든 요청을 일시 정지"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        priority: int = INTERACTIVE,
+        headers: Optional[dict] = None,
+        **kwargs
+    ) -> HttpResponse:
+        """Spotify Web API 요청 (인증 헤더, 속도 제한, 재시도 처리)"""
+        url = path if path.startswith('http') else f"{config.spotify_api_url}{path}"
+        response = None
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self._stats['retries'] += 1
+
+            await self.acquire(priority)
+            access_token = await spotify_tokens.get_token()
+            request_headers = {**(headers or {}), 'Authorization': f'Bearer {access_token}'}
+
+            self._stats['requests'] += 1
+            try:
+                response = await request('spotify_api', method, url, headers=request_headers, **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(self._backoff(attempt))
+                continue
+
+            if response.status == 429:
+                self._stats['throttled'] += 1
+                self.pause(self._retry_after(response) + random.uniform(0, self.backoff_base))
+                continue
+
+            if response.status == 401 and attempt < self.max_retries:
+                # 토큰이 무효화된 경우 새로 발급 후 재시도
+                spotify_tokens.invalidate()
+                continue
+
+            if response.status >= 500 and attempt < self.max_retries:
+                await asyncio.sleep(self._backoff(attempt))
+                continue
+
+            return response
+
+        return response
+
+    def stats(self) -> dict:
+        return {
+            **self._stats,
+            'queue_depth': sum(1 for _, _, future in self._waiters if not future.done()),
+            'paused_seconds': max(0.0, round(self._paused_until - time.monotonic(), 3)),
+            'available_tokens': round(self._tokens, 2),
+        }
+
+    def _retry_after(self, response: HttpResponse) -> float:
+        try:
+            return float(response.headers.get('Retry-After', 1))
+        except ValueError:
+            return 1.0
+
+    def _backoff(self, attempt: int) -> float:
+        # full jitter 지수 백오프
+        return random.uniform(0, self.backoff_base * (2 ** attempt))
+
+    def _wake_dispatcher(self) -> None:
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def _dispatch(self) -> None:
+        while self._waiters:
+            now = time.monotonic()
+            if now < self._paused_until:
+                await asyncio.sleep(self._paused_until - now)
+                continue
+
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                continue
+
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue  # 대기 중 취소된 요청
+
+            self._tokens -= 1
+            future.set_result(None)
+
+
+spotify_scheduler = SpotifyScheduler(
+    rate=config.spotify_rate_limit,
+    burst=config.spotify_rate_burst,
+    max_retries=config.spotify_max_retries,
+    backoff_base=config.spotify_backoff_base
+)
+
+register_stats('spotify_scheduler', spotify_scheduler.stats)
@@ -0,0 +1,90 @@
+import asyncio
+import base64
+import time
+from typing import Optional
+from core.config import get_config
+from core.http_client import request
+from core.metrics import register_stats
+
+config = get_config()
+
+
+class SpotifyTokenManager:
+    """
+    앱 전체에서 공유하는 Spotify client-credentials 토큰 관리자
+    - 동시에 여러 요청이 만료를 만나도 토큰 발급 요청은 하나만 실행 (single-flight)
+    - 만료 refresh_margin초 전부터 미리 갱신, 갱신 중에는 아직 유효한 기존 토큰 사용
+    """
+
+    def __init__(self, refresh_margin: float):
+        self.refresh_margin = refresh_margin
+        self._access_token: Optional[str] = None
+        self._expires_at = 0.0
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.fetch_count = 0
+
+    async def get_token(self) -> str:
+        now = time.monotonic()
+        if self._access_token and now < self._expires_at - self.refresh_margin:
+            return self._access_token
+
+        task = self._ensure_refresh()
+
+        # 기존 토큰이 아직 만료되지 않았으면 갱신을 기다리지 않음
+        if self._access_token and now < self._expires_at:
+            return self._access_token
+
+        return await asyncio.shield(task)
+
+    def invalidate(self) -> None:
+        """401 응답 등으로 토큰이 무효해졌을 때 다음 요청에서 새로 발급"""
+        self._access_token = None
+        self._expires_at = 0.0
+
+    def _ensure_refresh(self) -> asyncio.Task:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh())
+            self._refresh_task.add_done_callback(self._log_refresh_error)
+        return self._refresh_task
+
+    async def _refresh(self) -> str:
+        auth_bytes = f"{config.SpotifyAPIKEY}:{config.SpotifySecretKey}".encode('ascii')
+        auth_base64 = base64.b64encode(auth_bytes).decode('ascii')
+
+        headers = {
+            'Authorization': f'Basic {auth_base64}',
+            'Content-Type': 'application/x-www-form-urlencoded'
+        }
+        data = {'grant_type': 'client_credentials'}
+
+        self.fetch_count += 1
+        response = await request(
+            'spotify_accounts', 'POST', f'{config.spotify_accounts_url}/api/token',
+            headers=headers, data=data, timeout=10
+        )
+
+        if response.status != 200:
+            raise Exception(f"Failed to get Spotify token: {response.status} - {response.text}")
+
+        token_data = response.data
+        self._access_token = token_data["access_token"]
+        self._expires_at = time.monotonic() + token_data.get("expires_in", 3600)
+
+        print("Successfully obtained Spotify token")
+        return self._access_token
+
+    def _log_refresh_error(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception():
+            print(f"Error getting Spotify token: {str(task.exception())}")
+
+    def stats(self) -> dict:
+        return {
+            'fetch_count': self.fetch_count,
+            'has_token': self._access_token is not None,
+            'expires_in': max(0, round(self._expires_at - time.monotonic())) if self._access_token else 0,
+        }
+
+
+spotify_tokens = SpotifyTokenManager(refresh_margin=config.spotify_token_refresh_margin)
+
+register_stats('spotify_token', spotify_tokens.stats)
@@ -0,0 +1,53 @@
+import time
+from typing import Awaitable, Callable, Optional
+from core.metrics import register_stats
+
+# 앱 시작 단계별 소요 시간과 준비 상태
+_state = {
+    'ready': False,
+    'started_at': None,
+    'total_seconds': None,
+    'phases': {},  # 단계 이름 → {'seconds': ..., 'error': ...}
+    'failed_required': [],
+}
+
+def get_startup_stats() -> dict:
+    return {**_state, 'phases': dict(_state['phases'])}
+
+register_stats('startup', get_startup_stats)
+
+def begin_startup() -> None:
+    _state['ready'] = False
+    _state['started_at'] = time.monotonic()
+    _state['phases'] = {}
+    _state['failed_required'] = []
+
+async def run_phase(name: str, func: Callable[[], Awaitable], required: bool = False) -> Optional[Exception]:
+    """시작 단계 하나를 실행하고 소요 시간 기록 (필수 단계가 실패하면 준비 완료로 표시하지 않음)"""
+    started = time.perf_counter()
+    error = None
+    try:
+        await func()
+    except Exception as e:
+        error = e
+        print(f"Startup phase '{name}' failed: {str(e)}")
+        if required:
+            _state['failed_required'].append(name)
+
+    _state['phases'][name] = {
+        'seconds': round(time.perf_counter() - started, 4),
+        'error': str(error) if error else None,
+    }
+    return error
+
+def finish_startup() -> None:
+    _state['total_seconds'] = round(time.monotonic() - _state['started_at'], 4)
+    _state['ready'] = not _state['failed_required']
+    print(f"Startup finished in {_state['total_seconds']}s (ready={_state['ready']})")
+
+def is_ready() -> bool:
+    return _state['ready']
+
+def mark_not_ready() -> None:
+    """종료 시작 시 readiness 해제"""
+    _state['ready'] = False
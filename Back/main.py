@@ -1,12 +1,24 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from Api.Api_router import router as api_router
 from User.user_router import router as user_router
 from Artist.artist_router import router as artist_router
 from Playlist.playlist_router import router as playlist_router
 
-from core.database import init_db
+from Api.chart_snapshot import chart_snapshots
+from Artist.popular_snapshot import popular_artist_snapshots
+from Artist.metadata_refresher import artist_metadata_refresher
+
+from core.database import init_db, warmup_db, close_db
 from core.config import get_config
+from core.http_client import start_http_clients, close_http_clients
+from core.dependencies import hash_password, shutdown_password_pool
+from core.spotify_token import spotify_tokens
+from core.instrumentation import MetricsMiddleware
+from core.metrics import render_metrics
+from core.startup import begin_startup, run_phase, finish_startup, is_ready, mark_not_ready, get_startup_stats
 
 routers = []
 routers.append(api_router)
@@ -15,7 +27,51 @@ routers.append(artist_router)
 routers.append(playlist_router)
 
 
+async def _init_db(config):
+    # 실패 시 init_db가 로그만 남기므로 warmup_db 단계에서 준비 실패로 기록됨
+    init_db(config=config)
+
+
+async def _prime_caches():
+    # 첫 요청이 스냅샷 생성을 기다리지 않도록 미리 채움
+    await chart_snapshots.get()
+    await popular_artist_snapshots.get()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    config = get_config()
+    begin_startup()
+
+    # 1. DB 엔진 생성 후 커넥션 풀 미리 채우기
+    await run_phase('init_db', lambda: _init_db(config), required=True)
+    await run_phase('warmup_db', lambda: warmup_db(config.db_warmup_connections), required=True)
+    # 2. 외부 API 공유 HTTP 클라이언트 생성 후 Spotify 토큰 미리 발급
+    await run_phase('http_clients', start_http_clients, required=True)
+    await run_phase('spotify_token', spotify_tokens.get_token)
+    # 3. bcrypt 백엔드 로드 (첫 로그인 지연 방지)
+    await run_phase('password_hasher', lambda: hash_password('warmup'))
+    # 4. 차트/인기 아티스트 스냅샷, 아티스트 메타데이터 백그라운드 갱신 시작
+    await run_phase('chart_snapshots', chart_snapshots.start)
+    await run_phase('popular_artist_snapshots', popular_artist_snapshots.start)
+    await run_phase('artist_metadata_refresher', artist_metadata_refresher.start)
+    if config.startup_prime_caches:
+        await run_phase('prime_caches', _prime_caches)
+
+    finish_startup()
+    yield
+    mark_not_ready()
+
+    await artist_metadata_refresher.stop()
+    await popular_artist_snapshots.stop()
+    await chart_snapshots.stop()
+    await close_http_clients()
+    shutdown_password_pool()
+    await close_db()
+
+
 app = FastAPI(
+    lifespan=lifespan,
     openapi_url="/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
@@ -33,7 +89,21 @@ app.add_middleware(
     allow_headers=["*"],  # 허용할 헤더
 )
 
-init_db(config=get_config())
+# 가장 바깥에서 요청 지연 시간/DB/외부 API 시간 측정
+app.add_middleware(MetricsMiddleware)
+
+
+@app.get("/ready")
+async def ready():
+    """준비 상태 확인 (시작 단계가 모두 끝나기 전에는 503)"""
+    if not is_ready():
+        return JSONResponse(status_code=503, content={"ready": False, **get_startup_stats()})
+    return {"ready": True, **get_startup_stats()}
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 텍스트 형식 지표"""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,97 @@
+"""
+테스트 공용 fixture
+- seeded_app: 로컬 Postgres에 테이블을 만들고 사용자/관심 아티스트/플레이리스트를 넣은 앱
+- 운영 DB를 가리키지 않도록 POSTGRESQL_ENDPOINT를 환경 변수로 명시했을 때만 실행 (.env는 보지 않음)
+"""
+import asyncio
+import os
+from datetime import datetime, timezone
+from typing import NamedTuple
+import pytest
+
+# core.config가 .env를 읽기 전에 실제 환경 변수만 확인
+LOCAL_POSTGRES = bool(os.environ.get("POSTGRESQL_ENDPOINT"))
+
+SEED_USERNAME = "budget_user"
+SEED_ARTISTS = 20
+SEED_SONGS = 20
+
+
+class SeededApp(NamedTuple):
+    app: object
+    loop: asyncio.AbstractEventLoop
+    headers: dict
+    user_id: int
+    playlist_id: int
+
+
+async def _seed(database) -> SeededApp:
+    from sqlalchemy import delete, insert, select
+    from bench.stub_upstream import fake_spotify_id
+    from core.dependencies import create_jwt
+    from core.models import Artist, Playlist, PlaylistSong, Song, User, UserLikedSong, user_favorite_artist
+    from main import app
+
+    now = datetime.now(timezone.utc)
+    artist_ids = [fake_spotify_id(f"budget-artist-{i}") for i in range(SEED_ARTISTS)]
+
+    async with database.DBSessionLocal() as db:
+        # 이전 실행에서 남은 시드 데이터 정리
+        user_ids = select(User.id).where(User.username == SEED_USERNAME).scalar_subquery()
+        playlist_ids = select(Playlist.id).where(Playlist.user_id.in_(user_ids)).scalar_subquery()
+        await db.execute(delete(PlaylistSong).where(PlaylistSong.playlist_id.in_(playlist_ids)))
+        await db.execute(delete(Playlist).where(Playlist.user_id.in_(user_ids)))
+        await db.execute(delete(UserLikedSong).where(UserLikedSong.user_id.in_(user_ids)))
+        await db.execute(delete(Song).where(Song.artist_id.in_(artist_ids)))
+        await db.execute(delete(User).where(User.username == SEED_USERNAME))
+        await db.execute(delete(Artist).where(Artist.id.in_(artist_ids)))
+
+        user = User(username=SEED_USERNAME, email=f"{SEED_USERNAME}@example.com", hashed_password="-")
+        db.add(user)
+        # fetched_at이 최신이라 Spotify에 요청하지 않음
+        db.add_all(
+            Artist(id=artist_id, name=f"Artist {i}", spotify_id=artist_id, genres=[], popularity=50, fetched_at=now)
+            for i, artist_id in enumerate(artist_ids)
+        )
+        await db.flush()
+
+        await db.execute(
+            insert(user_favorite_artist),
+            [{"user_id": user.id, "artist_id": artist_id} for artist_id in artist_ids]
+        )
+        songs = [Song(title=f"Song {i}", artist_id=artist_ids[i % SEED_ARTISTS]) for i in range(SEED_SONGS)]
+        playlist = Playlist(title="Budget playlist", user_id=user.id)
+        db.add_all(songs + [playlist])
+        await db.flush()
+
+        db.add_all(
+            PlaylistSong(playlist_id=playlist.id, song_id=song.id, position=position)
+            for position, song in enumerate(songs)
+        )
+        db.add_all(UserLikedSong(user_id=user.id, song_id=song.id) for song in songs[::2])
+        await db.commit()
+
+        headers = {"Authorization": f"Bearer {create_jwt(data={'sub': str(user.id)})}"}
+        return SeededApp(app, asyncio.get_running_loop(), headers, user.id, playlist.id)
+
+
+@pytest.fixture(scope="session")
+def seeded_app():
+    if not LOCAL_POSTGRES:
+        pytest.skip("Set POSTGRESQL_ENDPOINT/PORT/TABLE/USER/PASSWORD (and DB_SSL_MODE=disable) to a local Postgres")
+
+    from bench.stub_upstream import configure_env, setup_database
+
+    # 외부 API는 호출하지 않지만 실제 Spotify로 나가지 않도록 설정
+    configure_env("http://127.0.0.1:9")
+
+    # 커넥션 풀이 이벤트 루프에 묶이므로 세션 동안 같은 루프 사용
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(setup_database())
+
+    from core import database
+    seeded = loop.run_until_complete(_seed(database))
+    yield seeded
+
+    loop.run_until_complete(database.close_db())
+    loop.close()
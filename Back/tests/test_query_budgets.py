@@ -0,0 +1,38 @@
+"""
+주요 엔드포인트의 쿼리 수 예산 (N+1 회귀 방지)
+- 시드 데이터가 있는 로컬 Postgres 필요, 없으면 skip (conftest.seeded_app 참고)
+- 캐시가 비어 있는 첫 요청 기준: 인증 사용자 조회 1개를 포함한 예산
+
+실행: cd Back && POSTGRESQL_ENDPOINT=... DB_SSL_MODE=disable python -m pytest -q tests
+"""
+import pytest
+from core.query_counter import assert_endpoint_max_queries
+
+
+@pytest.mark.parametrize("path, max_queries", [
+    ("/users/me", 1),
+    ("/artists/favorites", 3),
+    ("/playlists/my-playlists", 2),
+])
+def test_endpoint_query_budget(seeded_app, path, max_queries):
+    from Artist.crud import invalidate_user_favorites
+    from User.principal import invalidate_principal
+
+    invalidate_principal(seeded_app.user_id)
+    invalidate_user_favorites(seeded_app.user_id)
+    status = seeded_app.loop.run_until_complete(
+        assert_endpoint_max_queries(seeded_app.app, "GET", path, max_queries, headers=seeded_app.headers)
+    )
+    assert status == 200
+
+
+def test_playlist_songs_query_budget_does_not_grow_with_songs(seeded_app):
+    from User.principal import invalidate_principal
+
+    invalidate_principal(seeded_app.user_id)
+    status = seeded_app.loop.run_until_complete(
+        assert_endpoint_max_queries(
+            seeded_app.app, "GET", f"/playlists/{seeded_app.playlist_id}/songs", 6, headers=seeded_app.headers
+        )
+    )
+    assert status == 200
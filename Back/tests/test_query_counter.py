@@ -0,0 +1,70 @@
+"""
+core.query_counter 단위 테스트 (DB 불필요)
+
+실행: cd Back && python -m pytest -q tests
+"""
+import pytest
+from core.query_counter import QueryCounter, assert_max_queries, normalize_statement, record_query
+
+
+def test_asyncpg_casts_do_not_swallow_following_sql():
+    statement = "SELECT artists.id FROM artists WHERE artists.id = $1::VARCHAR AND artists.name = $2::VARCHAR"
+    assert normalize_statement(statement) == "SELECT artists.id FROM artists WHERE artists.id = ? AND artists.name = ?"
+
+
+def test_cast_before_limit_keeps_limit():
+    statement = "SELECT songs.id FROM songs WHERE songs.album_id = $1::INTEGER LIMIT $2::INTEGER"
+    assert normalize_statement(statement) == "SELECT songs.id FROM songs WHERE songs.album_id = ? LIMIT ?"
+
+
+def test_multi_word_and_array_casts():
+    statement = (
+        "UPDATE artists SET fetched_at=$1::TIMESTAMP WITH TIME ZONE, genres=$2::VARCHAR[] "
+        "WHERE artists.id = $3::VARCHAR"
+    )
+    assert normalize_statement(statement) == "UPDATE artists SET fetched_at=?, genres=? WHERE artists.id = ?"
+
+
+def test_in_lists_of_any_length_share_a_shape():
+    short = "SELECT artists.id FROM artists WHERE artists.id IN ($1::VARCHAR)"
+    long = "SELECT artists.id FROM artists WHERE artists.id IN ($1::VARCHAR, $2::VARCHAR, $3::VARCHAR)"
+    assert normalize_statement(short) == normalize_statement(long)
+    assert normalize_statement(long) == "SELECT artists.id FROM artists WHERE artists.id IN (?)"
+
+
+def test_literals_and_other_paramstyles():
+    assert normalize_statement("SELECT * FROM users WHERE username = 'o''brien' AND id = 42") == \
+        "SELECT * FROM users WHERE username = ? AND id = ?"
+    assert normalize_statement("SELECT * FROM users WHERE id = %(id_1)s") == "SELECT * FROM users WHERE id = ?"
+    assert normalize_statement("SELECT *\n  FROM   users\tWHERE id = ?") == "SELECT * FROM users WHERE id = ?"
+
+
+def test_distinct_statements_stay_distinct():
+    by_id = normalize_statement("SELECT artists.id FROM artists WHERE artists.id = $1::VARCHAR")
+    by_name = normalize_statement("SELECT artists.id FROM artists WHERE artists.name = $1::VARCHAR")
+    assert by_id != by_name
+
+
+def test_nested_counters_each_record():
+    with QueryCounter() as outer:
+        record_query("SELECT 1")
+        with QueryCounter() as inner:
+            record_query("SELECT songs.id FROM songs WHERE songs.id = $1::INTEGER")
+            record_query("SELECT songs.id FROM songs WHERE songs.id = $1::INTEGER")
+
+    record_query("SELECT 1")  # 활성 카운터 없음
+    assert outer.count == 3
+    assert inner.count == 2
+    assert inner.repeated(1) == [("SELECT songs.id FROM songs WHERE songs.id = ?", 2)]
+
+
+def test_assert_max_queries():
+    with assert_max_queries(2) as counter:
+        record_query("SELECT 1")
+        record_query("SELECT 2")
+    assert counter.count == 2
+
+    with pytest.raises(AssertionError, match="Expected at most 1 queries, got 2 queries"):
+        with assert_max_queries(1):
+            record_query("SELECT users.id FROM users WHERE users.id = $1::INTEGER")
+            record_query("SELECT users.id FROM users WHERE users.id = $1::INTEGER")